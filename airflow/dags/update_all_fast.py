@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta
+from airflow import DAG
+from airflow.exceptions import AirflowException
+from airflow.operators.python import PythonOperator
+from airflow.stats import Stats
+import os
+import sys
+
+# --- Đường dẫn gốc dự án ---
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ETL_DIR = os.path.join(PROJECT_DIR, "etl")
+
+
+def run_all_sources(ti, **_):
+    """
+    Fast path: 6 nguồn + _total_load trong 1 process (python3 -m pipeline --parallel).
+    Thời gian từng nguồn được đẩy lên XCom (key "timings", "<nguồn>_seconds")
+    và metric statsd bank_news.source.<nguồn>.duration.
+    """
+    # pipeline dùng đường dẫn tương đối ../db, data/ theo thư mục etl/
+    os.chdir(ETL_DIR)
+    if ETL_DIR not in sys.path:
+        sys.path.insert(0, ETL_DIR)
+    from pipeline.runner import print_report, run
+
+    report = run(parallel=True)
+    print_report(report)
+
+    timings = {}
+    for name, r in report.items():
+        timings[name] = round(r["seconds"], 2)
+        ti.xcom_push(key=f"{name}_seconds", value=timings[name])
+        Stats.timing(f"bank_news.source.{name}.duration", timedelta(seconds=r["seconds"]))
+        if r["inserted"] is not None:
+            Stats.gauge(f"bank_news.source.{name}.inserted", r["inserted"])
+    ti.xcom_push(key="timings", value=timings)
+
+    failed = [name for name, r in report.items() if r["error"]]
+    if failed:
+        raise AirflowException(f"Failed: {', '.join(failed)}")
+
+
+# --- DAG definition ---
+default_args = {
+    "owner": "airflow",
+    "depends_on_past": False,
+    "retries": 1,
+}
+
+dag = DAG(
+    dag_id="update_all_fast",
+    default_args=default_args,
+    start_date=datetime(2026, 1, 1),
+    schedule_interval=None,  # Chạy thủ công; thay lịch của update_all nếu dùng bản này
+    catchup=False,
+)
+
+# --- 1 task duy nhất: không fork bash / venv / interpreter cho từng bước ---
+run_all = PythonOperator(
+    task_id="run_all_sources",
+    python_callable=run_all_sources,
+    dag=dag
+)
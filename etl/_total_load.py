@@ -1,8 +1,25 @@
 import os
 import sqlite3
 
+from pipeline import metrics, stories
+from pipeline.sources import get_source, vne
+
 DB_DIR = "../db"
 OUTPUT_DB = os.path.join(DB_DIR, "total_news.db")
+STATE_TABLE = "merge_state"
+FTS_TABLE = "articles_fts"
+BUSY_TIMEOUT = 30  # giây chờ khi GUI đang giữ lock
+VERSION_TABLE = "data_version"  # GUI dùng làm khoá cache, tăng mỗi lần có dữ liệu mới
+SUMMARY_TABLE = "daily_counts"  # (ngày, category, nguồn) -> số tin, cho panel thống kê của GUI
+
+# Gom các dòng articles có rowid > ? theo (ngày local, category, nguồn)
+SUMMARY_SELECT = """
+    SELECT IFNULL(date(publish_ts, 'unixepoch', 'localtime'), ''), IFNULL(category, ''),
+           IFNULL(source, ''), COUNT(*)
+    FROM main.articles
+    WHERE rowid > ?
+    GROUP BY 1, 2, 3
+"""
 
 SOURCE_MAP = {
     "vst": "VietStock",
@@ -22,13 +39,155 @@ def get_table_schema(conn, table_name):
     return [(row[1], row[2]) for row in cur.fetchall()]
 
 
+def ensure_indexes(conn):
+    """
+    Index cho các query của GUI: ORDER BY publish_ts DESC, lọc category / khoảng thời gian
+    """
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_articles_publish_ts
+        ON articles (publish_ts DESC)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_articles_category_ts
+        ON articles (category, publish_ts DESC)
+    """)
+    conn.commit()
+
+
+def ensure_fts(conn):
+    """
+    FTS5 trên title / title_latin cho ô tìm kiếm của GUI (external content = articles, khoá rowid).
+    Lần đầu tạo thì build từ toàn bộ articles, sau đó _total_load chỉ thêm các dòng mới.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (FTS_TABLE,)
+    ).fetchone()
+    if exists:
+        return
+
+    conn.execute(f"""
+        CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+            title,
+            title_latin,
+            content='articles',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+    """)
+    conn.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES('rebuild')")
+    bump_data_version(conn)
+    conn.commit()
+    print(f"[INFO] Built {FTS_TABLE}")
+
+
+def ensure_summary(conn):
+    """
+    Bảng đếm số tin theo (day, category, source). Lần đầu tạo thì đếm toàn bộ articles,
+    sau đó mỗi lần merge chỉ cộng thêm các dòng mới.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (SUMMARY_TABLE,)
+    ).fetchone()
+    if exists:
+        return
+
+    conn.execute(f"""
+        CREATE TABLE {SUMMARY_TABLE} (
+            day TEXT NOT NULL,
+            category TEXT NOT NULL,
+            source TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (day, category, source)
+        ) WITHOUT ROWID
+    """)
+    conn.execute(f"INSERT INTO {SUMMARY_TABLE} (day, category, source, count) {SUMMARY_SELECT}", (0,))
+    bump_data_version(conn)
+    conn.commit()
+    print(f"[INFO] Built {SUMMARY_TABLE}")
+
+
+def ensure_stories(conn):
+    """
+    Cột story_id (gom tin trùng giữa các nguồn, xem pipeline/stories.py). Lần đầu thêm cột thì
+    gom story cho toàn bộ articles, sau đó mỗi lần merge chỉ xử lý các dòng mới.
+    """
+    with conn:
+        if not stories.ensure_schema(conn):
+            return
+        processed, joined = stories.assign(conn)
+        bump_data_version(conn)
+    print(f"[INFO] Built {stories.STORY_COLUMN}: {processed} articles, {joined} joined an existing story")
+
+
+def ensure_vne_utc(conn):
+    """
+    Migration 1 lần (PRAGMA user_version): publish_ts các tin vne cũ tính lại theo UTC
+    (xem pipeline/sources/vne.py), kèm daily_counts + story_buckets của các tin đó.
+    db/vne.db được sửa trước để các lần merge sau không mang giờ cũ vào.
+    """
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= vne.UTC_TS_VERSION:
+        return
+
+    source = get_source("vne")
+    if os.path.exists(source.db_path):
+        src_conn = sqlite3.connect(source.db_path)
+        try:
+            with src_conn:
+                source.ensure_schema(src_conn)
+        finally:
+            src_conn.close()
+
+    source_name = SOURCE_MAP["vne"]
+    with conn:
+        fixed = vne.fix_publish_ts(conn, "source = ?", (source_name,))
+        if fixed:
+            conn.execute(f"DELETE FROM {SUMMARY_TABLE} WHERE source = ?", (source_name,))
+            conn.execute(f"""
+                INSERT INTO {SUMMARY_TABLE} (day, category, source, count)
+                SELECT IFNULL(date(publish_ts, 'unixepoch', 'localtime'), ''), IFNULL(category, ''),
+                       source, COUNT(*)
+                FROM articles
+                WHERE source = ?
+                GROUP BY 1, 2, 3
+            """, (source_name,))
+            conn.execute(f"""
+                UPDATE {stories.BUCKET_TABLE}
+                SET publish_ts = (SELECT a.publish_ts FROM articles a WHERE a.rowid = rid)
+                WHERE rid IN (SELECT rowid FROM articles WHERE source = ?)
+            """, (source_name,))
+            bump_data_version(conn)
+        conn.execute(f"PRAGMA user_version = {vne.UTC_TS_VERSION}")
+    print(f"[INFO] vne publish_ts as UTC: fixed {fixed} articles")
+
+
+def bump_data_version(conn):
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {VERSION_TABLE} (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL,
+            updated_at TEXT
+        )
+    """)
+    conn.execute(f"""
+        INSERT INTO {VERSION_TABLE} (id, version, updated_at) VALUES (1, 1, datetime('now'))
+        ON CONFLICT(id) DO UPDATE SET
+            version = version + 1,
+            updated_at = excluded.updated_at
+    """)
+
+
 def main():
+    with metrics.stage("all", "total_load") as m:
+        merge_all(m)
+
+
+def merge_all(total: metrics.StageMetrics):
     # --- Kết nối DB output ---
-    out_conn = sqlite3.connect(OUTPUT_DB)
+    out_conn = sqlite3.connect(OUTPUT_DB, timeout=BUSY_TIMEOUT)
+    # WAL: GUI vẫn đọc được trong lúc merge
+    out_conn.execute("PRAGMA journal_mode=WAL")
     out_cur = out_conn.cursor()
 
     base_schema = None
-    insert_sql = None
     col_names = None
 
     # --- Kiểm tra table articles đã tồn tại chưa ---
@@ -69,16 +228,56 @@ def main():
     else:
         # Nếu table đã tồn tại, đọc schema
         base_schema = get_table_schema(out_conn, "articles")
-        col_names = [name for name, _ in base_schema if name != "source"]
+        col_names = [name for name, _ in base_schema if name not in ("source", stories.STORY_COLUMN)]
+
+    ensure_indexes(out_conn)
+
+    # --- Tạo bảng categories nếu chưa tồn tại ---
+    out_cur.execute("""
+        CREATE TABLE IF NOT EXISTS categories (
+            category TEXT PRIMARY KEY
+        )
+    """)
 
-    # --- Prepare insert SQL ---
-    placeholders = ",".join(["?"] * (len(col_names) + 1))
+    # --- Cursor merge: rowid lớn nhất đã gộp của từng DB nguồn ---
+    out_cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS {STATE_TABLE} (
+            source TEXT PRIMARY KEY,
+            last_rowid INTEGER NOT NULL,
+            updated_at TEXT
+        )
+    """)
+    out_conn.commit()
+
+    ensure_fts(out_conn)
+    ensure_summary(out_conn)
+    ensure_stories(out_conn)
+    ensure_vne_utc(out_conn)
+
+    cols = ",".join(col_names)
     insert_sql = f"""
-        INSERT OR IGNORE INTO articles ({",".join(col_names)}, source)
-        VALUES ({placeholders})
+        INSERT OR IGNORE INTO articles ({cols}, source)
+        SELECT {cols}, ? FROM src.articles
+        WHERE rowid > ?
+        ORDER BY rowid
+    """
+    category_sql = """
+        INSERT OR IGNORE INTO categories (category)
+        SELECT DISTINCT category FROM src.articles
+        WHERE rowid > ? AND category IS NOT NULL AND category != ''
+    """
+    fts_sql = f"""
+        INSERT INTO {FTS_TABLE} (rowid, title, title_latin)
+        SELECT rowid, title, title_latin FROM main.articles
+        WHERE rowid > ?
+    """
+    summary_sql = f"""
+        INSERT INTO {SUMMARY_TABLE} (day, category, source, count)
+        {SUMMARY_SELECT}
+        ON CONFLICT(day, category, source) DO UPDATE SET count = count + excluded.count
     """
 
-    # --- Duyệt từng DB nguồn ---
+    # --- Duyệt từng DB nguồn: chỉ gộp các dòng mới (rowid > cursor), toàn bộ chạy trong SQLite ---
     for short_name, source_name in SOURCE_MAP.items():
         db_path = os.path.join(DB_DIR, f"{short_name}.db")
         if not os.path.exists(db_path):
@@ -86,46 +285,54 @@ def main():
             continue
 
         print(f"[INFO] Processing {db_path}")
-        in_conn = sqlite3.connect(db_path)
-        in_cur = in_conn.cursor()
-
-        select_sql = f"SELECT {','.join(col_names)} FROM articles"
+        out_conn.execute("ATTACH DATABASE ? AS src", (db_path,))
         try:
-            rows = in_cur.execute(select_sql).fetchall()
-        except sqlite3.OperationalError:
-            print(f"[WARN] Table 'articles' not found in {db_path}, skipping")
-            in_conn.close()
-            continue
-
-        data_to_insert = [tuple(row) + (source_name,) for row in rows]
+            try:
+                max_rowid = out_conn.execute("SELECT IFNULL(MAX(rowid), 0) FROM src.articles").fetchone()[0]
+            except sqlite3.OperationalError:
+                print(f"[WARN] Table 'articles' not found in {db_path}, skipping")
+                continue
 
-        out_cur.executemany(insert_sql, data_to_insert)
-        out_conn.commit()
-
-        print(f"[INFO] Inserted {len(rows)} records from {short_name}")
-
-        in_conn.close()
+            row = out_conn.execute(
+                f"SELECT last_rowid FROM {STATE_TABLE} WHERE source = ?", (short_name,)
+            ).fetchone()
+            last_rowid = row[0] if row else 0
 
-    # --- Tạo bảng categories nếu chưa tồn tại ---
-    out_cur.execute("""
-        CREATE TABLE IF NOT EXISTS categories (
-            category TEXT PRIMARY KEY
-        )
-    """)
-    out_conn.commit()
+            # DB nguồn bị tạo lại (rowid nhỏ hơn cursor) -> quét lại từ đầu, dedup nhờ unique index
+            if max_rowid < last_rowid:
+                print(f"[WARN] {short_name}: rowid reset ({max_rowid} < {last_rowid}), full re-merge")
+                last_rowid = 0
 
-    # --- Lấy tất cả category duy nhất từ articles ---
-    out_cur.execute("SELECT DISTINCT category FROM articles")
-    categories = [row[0] for row in out_cur.fetchall() if row[0]]
+            with metrics.stage(short_name, "merge") as m, out_conn:
+                # các dòng vừa thêm vào total_news.db: rowid > prev_rowid
+                prev_rowid = out_conn.execute("SELECT IFNULL(MAX(rowid), 0) FROM main.articles").fetchone()[0]
+                inserted = out_conn.execute(insert_sql, (source_name, last_rowid)).rowcount
+                out_conn.execute(fts_sql, (prev_rowid,))
+                out_conn.execute(summary_sql, (prev_rowid,))
+                out_conn.execute(category_sql, (last_rowid,))
+                _, joined = stories.assign(out_conn, prev_rowid)
+                out_conn.execute(f"""
+                    INSERT INTO {STATE_TABLE} (source, last_rowid, updated_at)
+                    VALUES (?, ?, datetime('now'))
+                    ON CONFLICT(source) DO UPDATE SET
+                        last_rowid = excluded.last_rowid,
+                        updated_at = excluded.updated_at
+                """, (short_name, max_rowid))
+                if inserted:
+                    bump_data_version(out_conn)
+                m.set("records_in", max(0, max_rowid - last_rowid))
+                m.set("inserted", inserted)
+                m.set("duplicates", max(0, max_rowid - last_rowid - inserted))
+                m.set("clustered", joined)
+            total.add("records_in", m.counters["records_in"])
+            total.add("inserted", inserted)
+            total.add("duplicates", m.counters["duplicates"])
+            total.add("clustered", joined)
 
-    # --- Chèn vào bảng categories ---
-    if categories:
-        out_cur.executemany(
-            "INSERT OR IGNORE INTO categories (category) VALUES (?)",
-            [(cat,) for cat in categories]
-        )
-        out_conn.commit()
-        print(f"[INFO] Inserted {len(categories)} unique categories into 'categories' table")
+            print(f"[INFO] Inserted {inserted} new records from {short_name} (rowid {last_rowid} -> {max_rowid}), "
+                  f"{joined} joined an existing story")
+        finally:
+            out_conn.execute("DETACH DATABASE src")
 
     out_conn.close()
     print("[DONE] Merge completed incrementally with dedup on (href_hash, source) and categories updated")
@@ -0,0 +1,103 @@
+"""
+Benchmark parse ngày đăng: datetime.strptime (cách cũ) vs pipeline.dates.DateFormat
+
+- Mỗi format 100.000 chuỗi sinh ngẫu nhiên trong 1 năm (gần như không trùng -> cache không giúp)
+- "repeat": 100.000 chuỗi lấy từ 2.000 giá trị khác nhau (feed lặp lại) -> đo thêm hiệu quả LRU cache
+- Lỗi (exit 1) nếu kết quả khác strptime (strptime + tz cố định như format của nguồn)
+
+Chạy từ thư mục etl/:
+    python3 bench/bench_dates.py [--count 100000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timezone
+
+ETL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ETL_DIR)
+
+from pipeline import dates  # noqa: E402
+
+BASE_TS = 1767225600  # 2026-01-01 00:00 UTC
+
+# tên -> (DateFormat, format strptime, tz khi chuỗi không có offset, hàm sinh chuỗi từ datetime)
+FORMATS = {
+    "rfc822 (vst/ktck)": (
+        dates.RFC822, "%a, %d %b %Y %H:%M:%S %z", None,
+        lambda dt: dt.astimezone(dates.VN_TZ).strftime("%a, %d %b %Y %H:%M:%S +0700"),
+    ),
+    "rfc822 GMT (vne)": (
+        dates.RFC822_GMT, "%a, %d %b %Y %H:%M:%S %Z", timezone.utc,
+        lambda dt: dt.strftime("%a, %d %b %Y %H:%M:%S GMT"),
+    ),
+    "tbkt": (
+        dates.TBKT, "%H:%M %d/%m/%Y", dates.VN_TZ,
+        lambda dt: dt.astimezone(dates.VN_TZ).strftime("%H:%M %d/%m/%Y"),
+    ),
+    "vnfi": (
+        dates.VNFI, "%d/%m/%y %H:%M", dates.VN_TZ,
+        lambda dt: dt.astimezone(dates.VN_TZ).strftime("%d/%m/%y %H:%M"),
+    ),
+    "nqs": (
+        dates.NQS, "%d/%m/%Y - %H:%M", dates.VN_TZ,
+        lambda dt: dt.astimezone(dates.VN_TZ).strftime("%d/%m/%Y - %H:%M"),
+    ),
+}
+
+
+def strptime_parse(raw: str, fmt: str, tz):
+    dt = datetime.strptime(raw, fmt)
+    if tz is not None:
+        dt = dt.replace(tzinfo=tz)
+    return dt.strftime("%Y/%m/%d %H:%M:%S"), int(dt.timestamp())
+
+
+def timed(func, values) -> float:
+    t0 = time.perf_counter()
+    for v in values:
+        func(v)
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    failed = False
+
+    for name, (date_format, fmt, tz, render) in FORMATS.items():
+        values = [
+            render(datetime.fromtimestamp(BASE_TS + rng.randrange(365 * 86400), timezone.utc))
+            for _ in range(args.count)
+        ]
+        distinct = values[:2000]
+        repeat = [rng.choice(distinct) for _ in range(args.count)]
+
+        mismatches = [v for v in values[:5000] if date_format.parse(v) != strptime_parse(v, fmt, tz)]
+        if mismatches:
+            print(f"[FAIL] {name}: {len(mismatches)} mismatches, e.g. {mismatches[0]!r}")
+            failed = True
+            continue
+
+        old = timed(lambda v: strptime_parse(v, fmt, tz), values)
+        date_format.parse.cache_clear()
+        new = timed(date_format.parse, values)
+        old_repeat = timed(lambda v: strptime_parse(v, fmt, tz), repeat)
+        date_format.parse.cache_clear()
+        new_repeat = timed(date_format.parse, repeat)
+
+        print(
+            f"[BENCH] {name:<18}: strptime {old:.2f}s -> {new:.2f}s ({old / new:.1f}x), "
+            f"repeat {old_repeat:.2f}s -> {new_repeat:.2f}s ({old_repeat / new_repeat:.1f}x) / {args.count} values"
+        )
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
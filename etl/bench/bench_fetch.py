@@ -0,0 +1,119 @@
+"""
+Benchmark lớp fetch: tuần tự (requests.get) vs Fetcher (song song)
+
+- Dựng 6 stub server local (mỗi server = 1 "host" nguồn tin), mỗi response có độ trễ giả lập
+- Body trả về là RSS dựng lại từ bench/fixtures/<source>_news.json (mẫu dữ liệu đã crawl)
+- Số URL mỗi host giống cấu hình thật: vst 13, vne 4, ktck 4, tbkt 5x5, vnfi 6, nqs 4x10
+
+Chạy từ thư mục etl/:
+    python3 bench/bench_fetch.py [--latency 0.2]
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from xml.sax.saxutils import escape
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pipeline.fetcher import Fetcher  # noqa: E402
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# source -> số request 1 lần extract
+HOSTS = {
+    "vst": 13,
+    "vne": 4,
+    "ktck": 4,
+    "tbkt": 25,
+    "vnfi": 6,
+    "nqs": 40,
+}
+
+
+def build_rss(source: str, limit: int = 50) -> bytes:
+    path = os.path.join(FIXTURE_DIR, f"{source}_news.json")
+    items = []
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            items = json.load(f)[:limit]
+
+    parts = ["<?xml version='1.0' encoding='utf-8'?><rss><channel>"]
+    for it in items:
+        parts.append(
+            f"<item><title>{escape(it.get('title') or '')}</title>"
+            f"<link>{escape(it.get('href') or '')}</link>"
+            f"<pubDate>{escape(it.get('publish_date') or '')}</pubDate></item>"
+        )
+    parts.append("</channel></rss>")
+    return "".join(parts).encode("utf-8")
+
+
+def start_stub(body: bytes, latency: float):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/rss+xml")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.2, help="độ trễ giả lập mỗi response (giây)")
+    args = parser.parse_args()
+
+    servers = []
+    urls = []
+    for source, count in HOSTS.items():
+        server = start_stub(build_rss(source), args.latency)
+        servers.append(server)
+        port = server.server_address[1]
+        urls.extend(f"http://127.0.0.1:{port}/{source}/{i}" for i in range(count))
+
+    print(f"[BENCH] {len(urls)} requests, {len(HOSTS)} hosts, latency {args.latency:.2f}s")
+
+    # --- tuần tự như các extractor cũ ---
+    t0 = time.perf_counter()
+    seq_bytes = 0
+    for url in urls:
+        resp = requests.get(url, timeout=15)
+        resp.raise_for_status()
+        seq_bytes += len(resp.content)
+    seq = time.perf_counter() - t0
+    print(f"[BENCH] sequential : {seq:.2f}s ({seq_bytes} bytes)")
+
+    # --- Fetcher dùng chung ---
+    t0 = time.perf_counter()
+    with Fetcher(rate=0) as fetcher:
+        results = fetcher.fetch_all(urls)
+    par = time.perf_counter() - t0
+    errors = [r for r in results if isinstance(r, Exception)]
+    par_bytes = sum(len(r.content) for r in results if not isinstance(r, Exception))
+    print(f"[BENCH] fetcher    : {par:.2f}s ({par_bytes} bytes, {len(errors)} errors)")
+
+    print(f"[BENCH] speedup    : x{seq / par:.1f}")
+
+    for server in servers:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
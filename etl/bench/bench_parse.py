@@ -0,0 +1,122 @@
+"""
+Microbenchmark parse 1 page HTML: parser cũ vs pipeline.html_select (lxml + XPath biên dịch sẵn)
+
+- Fixture: bench/fixtures/<source>_*.html (page chuyên mục lưu sẵn, dựng từ bench/fixtures/<source>_news.json)
+- tbkt: cũ = 4 XPath chuỗi / article; mới = 1 XPath biên dịch / article
+- vnfi: cũ = BeautifulSoup "html.parser" + find_all; mới = lxml + XPath biên dịch
+- Lỗi (exit 1) nếu 2 parser cho ra record khác nhau
+
+Chạy từ thư mục etl/:
+    python3 bench/bench_parse.py [--runs 200]
+"""
+import argparse
+import contextlib
+import glob
+import io
+import os
+import statistics
+import sys
+import time
+
+from bs4 import BeautifulSoup
+from lxml import html
+
+ETL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE_DIR = os.path.join(ETL_DIR, "bench", "fixtures")
+sys.path.insert(0, ETL_DIR)
+
+from pipeline.sources import get_source  # noqa: E402
+
+
+# ---------- parser cũ (trước html_select) ----------
+
+def tbkt_parse_old(content: bytes, spec: dict) -> list:
+    tree = html.fromstring(content)
+    records = []
+    for article in tree.xpath("//article[@class='article']"):
+        title_nodes = article.xpath(".//h3[@class='article-title']/a/text()")
+        link_nodes = article.xpath(".//h3[@class='article-title']/a/@href")
+        time_nodes = article.xpath(".//span[@class='article-publish-time']//span[@class='format_time']/text()")
+        date_nodes = article.xpath(".//span[@class='article-publish-time']//span[@class='format_date']/text()")
+        if not (title_nodes and link_nodes and time_nodes and date_nodes):
+            continue
+        records.append({
+            "title": title_nodes[0].strip(),
+            "href": link_nodes[0].strip(),
+            "category": spec["category"],
+            "publish_date": f"{time_nodes[0].strip()} {date_nodes[0].strip()}"
+        })
+    return records
+
+
+def vnfi_parse_old(content: bytes, spec: dict) -> list:
+    soup = BeautifulSoup(content, "html.parser")
+    records = []
+    articles_div = soup.find("div", id="load_more_cate_pc")
+    if not articles_div:
+        return records
+    for article in articles_div.find_all("div", class_="article"):
+        h3_tag = article.find("h3", class_="article__title")
+        a_tag = h3_tag.find("a") if h3_tag else None
+        if not a_tag:
+            continue
+        datetime_div = article.find("div", class_="detail-time-public")
+        records.append({
+            "title": a_tag.get_text(strip=True),
+            "href": a_tag.get("href", "").strip(),
+            "category": spec["category"],
+            "publish_date": datetime_div.get_text(strip=True) if datetime_div else None
+        })
+    return records
+
+
+OLD_PARSERS = {"tbkt": tbkt_parse_old, "vnfi": vnfi_parse_old}
+
+
+def timed_runs(func, runs: int) -> list:
+    samples = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    failed = False
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.html"))):
+        name = os.path.basename(path).split("_")[0]
+        if name not in OLD_PARSERS:
+            continue
+
+        with open(path, "rb") as f:
+            content = f.read()
+        source = get_source(name)
+        spec = {"url": f"fixture://{os.path.basename(path)}", "category": "chung-khoan"}
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            old_records = OLD_PARSERS[name](content, spec)
+            new_records = source.parse(content, spec)
+        if old_records != new_records:
+            print(f"[FAIL] {name}: records differ ({len(old_records)} old vs {len(new_records)} new)")
+            failed = True
+            continue
+
+        old = statistics.median(timed_runs(lambda: OLD_PARSERS[name](content, spec), args.runs))
+        new = statistics.median(timed_runs(lambda: source.parse(content, spec), args.runs))
+        print(
+            f"[BENCH] {name}: {len(new_records)} records, {len(content) / 1024:.0f} KB/page, "
+            f"old {old * 1000:.2f} ms -> new {new * 1000:.2f} ms per page ({old / new:.1f}x)"
+        )
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
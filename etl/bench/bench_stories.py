@@ -0,0 +1,113 @@
+"""
+Benchmark gom story (pipeline/stories.py) khi total_news.db lớn dần
+
+- DB tạm: N tin sinh ngẫu nhiên trong 1 năm, 1/4 số tin được 1-3 nguồn khác đăng lại
+  (đổi / bỏ 1-2 từ, lệch vài giờ)
+- gán story theo từng đợt BATCH tin như _total_load: thời gian mỗi tin phải gần như không đổi
+  khi bảng lớn lên (tra bucket theo index, không so với toàn bộ tin)
+- recall: tỷ lệ bản đăng lại (Jaccard với tin gốc >= STORY_THRESHOLD) vào đúng story gốc,
+  đo phần LSH bỏ sót; bản sửa nhiều hơn ngưỡng thì không gộp là đúng thiết kế
+- nhầm: tin khác nhau bị gộp chung
+- Lỗi (exit 1) nếu recall < 0.95 hoặc nhầm > 1%
+
+Chạy từ thư mục etl/:
+    python3 bench/bench_stories.py [--count 50000]
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import time
+
+ETL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ETL_DIR)
+
+from pipeline import stories  # noqa: E402
+
+SOURCES = ["VietStock", "VietNamFinance", "VnEconomy", "ThoiBaoKinhTe", "NguoiQuanSat", "KinhTeChungKhoan"]
+WORDS = (
+    "ngân hàng lãi suất tín dụng cổ phiếu trái phiếu chứng khoán vốn lợi nhuận quý năm tăng giảm "
+    "doanh nghiệp thị trường bất động sản tỷ đồng USD nợ xấu đầu tư công giải ngân dự báo GDP "
+    "xuất khẩu tỷ giá vàng giá dầu thuế phí quy định nghị quyết Chính phủ Thủ tướng NHNN Basel "
+    "phát hành cổ tức kết quả kinh doanh kế hoạch mục tiêu kỷ lục mạnh nhẹ cao thấp mới"
+).split()
+BASE_TS = 1735689600  # 2025-01-01
+BATCH = 1000
+
+
+def make_articles(count: int, rng: random.Random) -> list:
+    """
+    -> [(title, source, publish_ts, gốc)], gốc = chỉ số tin gốc (tin đăng lại) hoặc chính nó
+    """
+    articles = []
+    while len(articles) < count:
+        origin = len(articles)
+        words = [rng.choice(WORDS) for _ in range(rng.randint(9, 16))]
+        ts = BASE_TS + rng.randrange(365 * 86400)
+        source = rng.choice(SOURCES)
+        articles.append((" ".join(words), source, ts, origin))
+        if rng.random() < 0.25:
+            for other in rng.sample([s for s in SOURCES if s != source], rng.randint(1, 3)):
+                copy = list(words)
+                for _ in range(rng.randint(1, 2)):
+                    i = rng.randrange(len(copy))
+                    if rng.random() < 0.5 and len(copy) > 9:
+                        del copy[i]
+                    else:
+                        copy[i] = rng.choice(WORDS)
+                articles.append((" ".join(copy), other, ts + rng.randrange(-6 * 3600, 6 * 3600), origin))
+    return articles[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=50000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    articles = make_articles(args.count, rng)
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE articles (title TEXT, publish_ts INTEGER, source TEXT)")
+    stories.ensure_schema(conn)
+
+    timings = []
+    for start in range(0, len(articles), BATCH):
+        chunk = articles[start:start + BATCH]
+        prev_rowid = conn.execute("SELECT IFNULL(MAX(rowid), 0) FROM articles").fetchone()[0]
+        with conn:
+            conn.executemany(
+                "INSERT INTO articles (title, source, publish_ts) VALUES (?, ?, ?)",
+                [(title, source, ts) for title, source, ts, _ in chunk]
+            )
+            t0 = time.perf_counter()
+            stories.assign(conn, prev_rowid)
+            timings.append((time.perf_counter() - t0) / len(chunk))
+
+    story_of = dict(conn.execute("SELECT rowid, story_id FROM articles"))
+    # rowid bắt đầu từ 1, articles[i] -> rowid i + 1
+    copies = [(i, origin) for i, (_, _, _, origin) in enumerate(articles) if origin != i]
+    eligible = [
+        (i, origin) for i, origin in copies
+        if stories.jaccard(stories.shingles(articles[i][0]), stories.shingles(articles[origin][0]))
+        >= stories.STORY_THRESHOLD
+    ]
+    recall = sum(story_of[i + 1] == story_of[origin + 1] for i, origin in eligible) / max(1, len(eligible))
+    recall_all = sum(story_of[i + 1] == story_of[origin + 1] for i, origin in copies) / max(1, len(copies))
+    wrong = sum(
+        story_of[i + 1] != i + 1 and articles[story_of[i + 1] - 1][3] != origin
+        for i, (_, _, _, origin) in enumerate(articles)
+    ) / len(articles)
+
+    first, last = timings[0], timings[-1]
+    print(f"[BENCH] {len(articles)} articles, {len(copies)} republished copies ({len(eligible)} above threshold)")
+    print(f"[BENCH] assign: first {BATCH} {first * 1e3:.3f} ms/article, last {BATCH} {last * 1e3:.3f} ms/article")
+    print(f"[BENCH] recall {recall:.3f} (all copies {recall_all:.3f}), wrongly merged {wrong:.4f}")
+    if recall < 0.95 or wrong > 0.01:
+        print("[FAIL] clustering quality below target")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
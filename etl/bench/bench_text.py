@@ -0,0 +1,127 @@
+"""
+Benchmark chuẩn hoá title / URL + md5: hàm per-record cũ vs batch API của pipeline.text
+
+- Dữ liệu: title + href trong bench/fixtures/*_news.json, lặp lại tới --count record (giống 1 lần backfill)
+- cũ : strip_accents (NFD + vòng lặp Python trên từng ký tự), urlparse/urlunparse, md5 từng record
+- mới: latinize_many (str.translate với bảng ký tự), normalize_urls (cắt chuỗi), md5_many
+- Lỗi (exit 1) nếu kết quả khác bản cũ (title: khác duy nhất ở đ/Đ -> d/D; nqs: phải giống hệt)
+
+Chạy từ thư mục etl/:
+    python3 bench/bench_text.py [--count 200000]
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+import unicodedata
+from urllib.parse import urlparse, urlunparse
+
+ETL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ETL_DIR)
+
+from pipeline import text  # noqa: E402
+
+
+# ---------- bản cũ (trước batch API) ----------
+
+def strip_accents_old(s: str) -> str:
+    s = unicodedata.normalize("NFD", s)
+    return "".join(ch for ch in s if unicodedata.category(ch) != "Mn")
+
+
+def normalize_title_latin_old(s: str) -> str:
+    if not s:
+        return ""
+    s = unicodedata.normalize("NFKD", s)
+    return s.encode("ascii", "ignore").decode("ascii").lower().strip()
+
+
+def normalize_url_old(url: str) -> str:
+    parsed = urlparse(url.strip())
+    return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), parsed.path.rstrip("/"), "", parsed.query, ""))
+
+
+def md5_old(s: str) -> str:
+    return hashlib.md5(s.encode("utf-8")).hexdigest()
+
+
+def load_samples() -> tuple:
+    titles, hrefs = [], []
+    for path in sorted(glob.glob(os.path.join(ETL_DIR, "bench", "fixtures", "*_news.json"))):
+        with open(path, "r", encoding="utf-8") as f:
+            for r in json.load(f):
+                titles.append(r["title"])
+                hrefs.append(r["href"])
+    # biến thể URL: host hoa, fragment, slash cuối, query rỗng, params, khoảng trắng
+    extra = []
+    for h in hrefs[:200]:
+        scheme, _, rest = h.partition("://")
+        host, _, path = rest.partition("/")
+        extra += [
+            f"{scheme.upper()}://{host.upper()}/{path}#top",
+            f" {h}/ ",
+            f"{h}?",
+            f"{h}?utm_source=x&b=1#frag",
+            f"{h};jsessionid=1",
+            f"{scheme}://{host}",
+        ]
+    return titles, hrefs + extra
+
+
+def timed(func):
+    t0 = time.perf_counter()
+    result = func()
+    return time.perf_counter() - t0, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=200000)
+    args = parser.parse_args()
+
+    titles, hrefs = load_samples()
+    if not titles:
+        print("[ERROR] No bench/fixtures/*_news.json samples")
+        sys.exit(1)
+
+    # --- đúng ---
+    failed = False
+    for t in titles:
+        expected = strip_accents_old(t.replace("đ", "d").replace("Đ", "D")).lower().strip()
+        if text.latinize_many([t])[0] != expected:
+            print(f"[FAIL] latinize: {t!r}")
+            failed = True
+            break
+    if text.normalize_title_latin_many(titles) != [normalize_title_latin_old(t) for t in titles]:
+        print("[FAIL] nqs normalize_title_latin differs")
+        failed = True
+    bad_urls = [h for h in hrefs if text.normalize_url(h) != normalize_url_old(h)]
+    if bad_urls:
+        print(f"[FAIL] normalize_url: {len(bad_urls)} differ, e.g. {bad_urls[0]!r}")
+        failed = True
+    if failed:
+        sys.exit(1)
+
+    # --- tốc độ ---
+    n = args.count
+    titles = (titles * (n // len(titles) + 1))[:n]
+    hrefs = (hrefs * (n // len(hrefs) + 1))[:n]
+
+    old, _ = timed(lambda: [strip_accents_old(t).lower().strip() for t in titles])
+    new, _ = timed(lambda: text.latinize_many(titles))
+    print(f"[BENCH] title_latin   : {old:.2f}s -> {new:.2f}s ({old / new:.1f}x), {n / new:,.0f} titles/s")
+
+    old, _ = timed(lambda: [normalize_title_latin_old(t) for t in titles])
+    new, _ = timed(lambda: text.normalize_title_latin_many(titles))
+    print(f"[BENCH] nqs title     : {old:.2f}s -> {new:.2f}s ({old / new:.1f}x)")
+
+    old, _ = timed(lambda: [md5_old(normalize_url_old(h)) for h in hrefs])
+    new, _ = timed(lambda: text.md5_many(text.normalize_urls(hrefs)))
+    print(f"[BENCH] url + md5     : {old:.2f}s -> {new:.2f}s ({old / new:.1f}x), {n / new:,.0f} urls/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Đo RAM đỉnh (tracemalloc) của transform + load file mode theo số record
+
+- Thư mục tạm giả lập etl/: .tmp/vst_*.ndjson sinh sẵn N record RSS, db/vst.db đã có sẵn
+  1 nửa số bài (nửa còn lại là bài mới)
+- transform_tmp -> data/vst_news.ndjson, rồi load_data_file -> db/vst.db
+- RAM đỉnh: record giữ theo batch (BATCH_SIZE); chỉ còn set href_hash chống trùng trong lần chạy
+  tăng theo N (vài chục byte / bài mới), không theo kích thước DB
+- thời gian đo khi đang bật tracemalloc (chậm hơn vài lần so với chạy thật)
+
+Chạy từ thư mục etl/:
+    python3 bench/bench_transform.py [--sizes 10000 50000]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ETL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ETL_DIR)
+
+from pipeline import metrics, stages  # noqa: E402
+from pipeline.ndjson_io import NdjsonWriter  # noqa: E402
+from pipeline.sources import get_source  # noqa: E402
+
+
+def raw_record(i: int) -> dict:
+    return {
+        "title": f"Tin thử nghiệm số {i}: lãi suất ngân hàng và thị trường chứng khoán",
+        "href": f"https://vietstock.vn/2026/01/bai-viet-so-{i}.htm",
+        "category": "chung-khoan",
+        "publish_date": "Mon, 12 Jan 2026 13:43:00 +0700",
+    }
+
+
+def run(size: int) -> tuple:
+    source = get_source("vst")
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, "etl", stages.TMP_DIR))
+        os.makedirs(os.path.join(tmp, "db"))
+        cwd = os.getcwd()
+        os.chdir(os.path.join(tmp, "etl"))
+        metrics.METRICS_DB = os.path.join(tmp, "etl_metrics.db")
+        metrics.METRICS_LOG = os.path.join(tmp, "etl_runs.jsonl")
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                # 1 nửa số bài đã có trong DB nguồn
+                stages.load(source, stages.transform(source, (raw_record(i) for i in range(0, size, 2))))
+                with NdjsonWriter(os.path.join(stages.TMP_DIR, "vst_chung-khoan.ndjson")) as writer:
+                    for batch in stages.batched(raw_record(i) for i in range(size)):
+                        writer.write_many(batch)
+
+                tracemalloc.start()
+                t0 = time.perf_counter()
+                stages.transform_tmp(source)
+                stages.load_data_file(source)
+                elapsed = time.perf_counter() - t0
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+        finally:
+            os.chdir(cwd)
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000])
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        elapsed, peak = run(size)
+        print(f"[BENCH] {size:>7} records: transform + load {elapsed:.2f}s, peak {peak / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
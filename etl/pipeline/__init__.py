@@ -0,0 +1,8 @@
+"""
+Pipeline ETL dùng chung cho mọi nguồn tin.
+
+- sources/: mỗi nguồn là 1 plugin Source (fetch spec, parser, date parser, category map)
+- stages: extract / transform / load dùng chung
+- runner: chạy tất cả nguồn trong 1 interpreter (python3 -m pipeline)
+- metrics: thời gian + counter từng stage -> logs/etl_runs.jsonl + bảng etl_runs
+"""
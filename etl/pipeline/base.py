@@ -0,0 +1,221 @@
+import os
+import sqlite3
+import threading
+import xml.etree.ElementTree as ET
+
+from . import text
+from .fetcher import Fetcher
+from .http_cache import HttpCache
+
+DB_DIR = "../db"
+
+# Header trình duyệt, một số nguồn trả 403 nếu thiếu
+BROWSER_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "vi-VN,vi;q=0.9,en-US;q=0.8,en;q=0.7"
+}
+
+
+class ExtractContext:
+    """
+    Trạng thái của 1 lần extract, truyền cho plugin
+    - fetcher: Fetcher dùng chung
+    - emit(key, records): nhận từng page/feed đã parse (thread-safe)
+    - watermarks / new_watermarks: watermark đã lưu và watermark mới (nguồn phân trang)
+    - parse_pool: ProcessPoolExecutor cho nguồn parse nặng (parse_in_pool), None = parse tại chỗ
+    """
+
+    def __init__(self, fetcher: Fetcher, emit, watermarks: dict = None,
+                 backfill: bool = False, cache: HttpCache = None, parse_pool=None):
+        self.fetcher = fetcher
+        self.watermarks = watermarks or {}
+        self.new_watermarks = {}
+        self.backfill = backfill
+        self.cache = cache
+        self.parse_pool = parse_pool
+        self._emit = emit
+        self._lock = threading.Lock()
+
+    def emit(self, key: str, records: list):
+        with self._lock:
+            self._emit(key, records)
+
+    def set_watermark(self, channel: str, value: int):
+        with self._lock:
+            self.new_watermarks[str(channel)] = value
+
+    def parse(self, source: "Source", content: bytes, spec: dict) -> list:
+        """
+        Parse 1 page: đẩy sang process pool nếu nguồn bật parse_in_pool (tránh GIL khi
+        nhiều nguồn chạy song song), ngược lại gọi thẳng source.parse
+        """
+        if self.parse_pool is not None and source.parse_in_pool:
+            return self.parse_pool.submit(parse_in_worker, source.name, content, spec).result()
+        return source.parse(content, spec)
+
+
+def parse_in_worker(name: str, content: bytes, spec: dict) -> list:
+    """
+    Chạy trong process con của parse_pool (hàm top-level để pickle được)
+    """
+    from .sources import get_source
+    return get_source(name).parse(content, spec)
+
+
+class Source:
+    """
+    Plugin 1 nguồn tin: fetch spec + parser + date parser + category map.
+    Transform / load dùng chung trong pipeline.stages, plugin chỉ override hook.
+
+    Raw record chuẩn sau extract: {"title", "href", "category", "publish_date"}
+    """
+
+    name = ""            # mã nguồn: tên file .tmp/data, tên DB
+    display_name = ""    # giá trị cột source trong total_news.db
+    headers = None
+    timeout = 15
+    specs = []           # [{"url": ..., "category": ...}]
+
+    # nguồn có watermark (phân trang) / dùng cache HTTP có điều kiện
+    paginated = False
+    use_cache = False
+
+    # bản ghi thiếu ngày đăng có được giữ không
+    require_date = True
+
+    # parse HTML nặng CPU -> chạy trong process pool khi runner --parallel
+    parse_in_pool = False
+
+    # unique index dùng để dedup khi load: (tên index, cột)
+    dedup_index = ("idx_articles_href_hash", "href_hash")
+
+    @property
+    def db_path(self) -> str:
+        return os.path.join(DB_DIR, f"{self.name}.db")
+
+    # ---------- extract ----------
+
+    def extract(self, ctx: ExtractContext):
+        """
+        Mặc định: mỗi spec 1 request, các spec chạy song song
+        """
+        ctx.fetcher.map(lambda spec: self.extract_spec(ctx, spec), self.specs)
+
+    def extract_spec(self, ctx: ExtractContext, spec: dict):
+        url = spec["url"]
+        try:
+            content = self.fetch(ctx, url)
+        except Exception as e:
+            print(f"[ERROR] {self.name}: Failed to fetch {url}: {e}")
+            return
+
+        if content is None:
+            return
+
+        ctx.emit(spec["category"], ctx.parse(self, content, spec))
+
+    def fetch(self, ctx: ExtractContext, url: str):
+        """
+        Trả về body (bytes), hoặc None nếu nội dung không đổi so với lần trước
+        """
+        if self.use_cache and ctx.cache is not None:
+            return ctx.cache.fetch(ctx.fetcher, url, headers=self.headers, timeout=self.timeout)
+
+        resp = ctx.fetcher.get(url, headers=self.headers, timeout=self.timeout)
+        resp.raise_for_status()
+        return resp.content
+
+    def parse(self, content: bytes, spec: dict) -> list:
+        raise NotImplementedError
+
+    # ---------- transform ----------
+
+    def parse_date(self, raw: str):
+        """
+        Trả về (publish_date "yyyy/mm/dd hh:mm:ss", unix ts)
+        """
+        raise NotImplementedError
+
+    def latinize(self, title: str) -> str:
+        return text.strip_accents(title).lower().strip()
+
+    def normalize_url(self, url: str) -> str:
+        return text.normalize_url(url)
+
+    # batch (transform gọi theo từng batch record)
+    def latinize_many(self, titles: list) -> list:
+        return text.latinize_many(titles)
+
+    def normalize_urls(self, urls: list) -> list:
+        return text.normalize_urls(urls)
+
+    # ---------- load ----------
+
+    def ensure_schema(self, conn: sqlite3.Connection):
+        """
+        Tạo bảng articles và categories nếu chưa tồn tại
+        """
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                href TEXT NOT NULL,
+                category TEXT NOT NULL,
+                publish_date TEXT NOT NULL,
+                title_latin TEXT NOT NULL,
+                href_hash BLOB NOT NULL,
+                publish_ts INTEGER NOT NULL
+            )
+        """)
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS categories (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL UNIQUE
+            )
+        """)
+
+    def insert_categories(self, conn: sqlite3.Connection, categories):
+        conn.executemany(
+            "INSERT OR IGNORE INTO categories (name) VALUES (?)",
+            [(c,) for c in categories]
+        )
+
+
+class RssSource(Source):
+    """
+    Nguồn RSS: mỗi spec là 1 feed, dùng GET có điều kiện (ETag / Last-Modified)
+    """
+
+    use_cache = True
+
+    def parse(self, content: bytes, spec: dict) -> list:
+        category = spec["category"]
+        root = ET.fromstring(content)
+        channel = root.find("channel")
+        if channel is None:
+            return []
+
+        records = []
+
+        for item in channel.findall("item"):
+            title = (item.findtext("title") or "").strip()
+            link = (item.findtext("link") or "").strip()
+            pub_date = (item.findtext("pubDate") or "").strip()
+
+            # chỉ lấy record đủ 4 field
+            if not (title and link and pub_date and category):
+                continue
+
+            records.append({
+                "title": title,
+                "href": link,
+                "category": category,
+                "publish_date": pub_date
+            })
+
+        return records
@@ -0,0 +1,73 @@
+"""
+Migration 1 lần: xoá bản ghi trùng href_hash, tạo unique index, VACUUM.
+
+Load tự chạy migration khi DB chưa có unique index; có thể chạy tay:
+    python3 -m pipeline.compaction [vst vne ...]
+"""
+import os
+import sqlite3
+import sys
+
+from .base import Source
+from .sources import SOURCES, get_source
+
+
+def has_index(conn: sqlite3.Connection, name: str) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='index' AND name=?", (name,)
+    ).fetchone()
+    return row is not None
+
+
+def ensure_dedup_index(source: Source) -> int:
+    """
+    Đảm bảo articles có unique index dedup của nguồn.
+    Nếu chưa có: giữ bản ghi đầu tiên (id nhỏ nhất) của mỗi nhóm trùng, xoá phần còn lại,
+    tạo index rồi VACUUM. Trả về số dòng đã xoá.
+    """
+    index_name, columns = source.dedup_index
+    os.makedirs(os.path.dirname(source.db_path), exist_ok=True)
+
+    conn = sqlite3.connect(source.db_path)
+    try:
+        with conn:
+            source.ensure_schema(conn)
+            if has_index(conn, index_name):
+                return 0
+
+            removed = conn.execute(f"""
+                DELETE FROM articles
+                WHERE id NOT IN (
+                    SELECT MIN(id) FROM articles GROUP BY {columns}
+                )
+            """).rowcount
+
+            conn.execute(f"CREATE UNIQUE INDEX {index_name} ON articles ({columns})")
+
+        # VACUUM không chạy được trong transaction
+        if removed:
+            conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+    print(f"[COMPACT] {source.name}: removed {removed} duplicate rows, created {index_name}")
+    return removed
+
+
+def main(argv=None):
+    names = (argv if argv is not None else sys.argv[1:]) or list(SOURCES)
+
+    for name in names:
+        source = get_source(name)
+        if not os.path.exists(source.db_path):
+            print(f"[WARN] Missing DB: {source.db_path}")
+            continue
+
+        size_before = os.path.getsize(source.db_path)
+        ensure_dedup_index(source)
+        size_after = os.path.getsize(source.db_path)
+        print(f"[COMPACT] {name}: {size_before} -> {size_after} bytes")
+
+
+if __name__ == "__main__":
+    main()
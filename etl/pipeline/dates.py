@@ -0,0 +1,138 @@
+"""
+Parse ngày đăng dùng chung cho mọi nguồn
+- DateFormat: biên dịch format kiểu strptime 1 lần thành regex, parse bằng int() + datetime(...)
+  (không qua strptime: chậm, phụ thuộc locale với %a / %b)
+- kết quả cache LRU theo chuỗi gốc (nhiều bài trùng giờ đăng, feed lặp lại giữa các lần chạy)
+- không khớp regex -> thử strptime (đường chậm), vẫn lỗi -> ValueError, transform đưa vào quarantine
+"""
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+VN_TZ = timezone(timedelta(hours=7))
+CACHE_SIZE = 8192
+EPOCH = datetime(1970, 1, 1)
+SECOND = timedelta(seconds=1)
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+# directive strptime -> nhóm regex
+DIRECTIVES = {
+    "d": r"(?P<d>\d{1,2})",
+    "m": r"(?P<m>\d{1,2})",
+    "Y": r"(?P<Y>\d{4})",
+    "y": r"(?P<y>\d{2})",
+    "H": r"(?P<H>\d{1,2})",
+    "M": r"(?P<M>\d{1,2})",
+    "S": r"(?P<S>\d{1,2})",
+    "a": r"[A-Za-z]{3}",
+    "b": r"(?P<b>[A-Za-z]{3})",
+    "z": r"(?P<z>[+-]\d{4})",
+    "Z": r"(?P<Z>GMT|UTC|UT)",
+}
+
+OUTPUT_FORMAT = "%Y/%m/%d %H:%M:%S"
+
+
+def compile_format(fmt: str) -> re.Pattern:
+    parts = []
+    i = 0
+    while i < len(fmt):
+        ch = fmt[i]
+        if ch == "%" and i + 1 < len(fmt):
+            directive = fmt[i + 1]
+            if directive not in DIRECTIVES:
+                raise ValueError(f"Unsupported directive %{directive} in {fmt!r}")
+            parts.append(DIRECTIVES[directive])
+            i += 2
+        elif ch.isspace():
+            parts.append(r"\s+")
+            i += 1
+        else:
+            parts.append(re.escape(ch))
+            i += 1
+    return re.compile("".join(parts))
+
+
+@lru_cache(maxsize=64)
+def offset_seconds(offset: str) -> int:
+    """
+    "+0700" -> 25200
+    """
+    sign = -1 if offset[0] == "-" else 1
+    return sign * (int(offset[1:3]) * 3600 + int(offset[3:5]) * 60)
+
+
+class DateFormat:
+    """
+    DateFormat("%H:%M %d/%m/%Y").parse("18:34 12/01/2026") -> ("2026/01/12 18:34:00", unix ts)
+    - format có %z / %Z: giờ theo offset trong chuỗi (GMT = UTC)
+    - không có: giờ theo tz (mặc định UTC+7, không phụ thuộc timezone của máy chạy)
+    - publish_date giữ nguyên giờ như trong chuỗi gốc
+    """
+
+    def __init__(self, fmt: str, tz: timezone = VN_TZ):
+        self.fmt = fmt
+        self.tz = tz
+        self.pattern = compile_format(fmt)
+        self.offset = int(tz.utcoffset(None).total_seconds())
+        self.parse = lru_cache(maxsize=CACHE_SIZE)(self._parse)
+
+    def _parse(self, raw: str):
+        raw = raw.strip()
+        m = self.pattern.fullmatch(raw)
+        result = self._from_match(m) if m else None
+        if result is None:
+            # đường chậm: chuỗi lệch format (vd. khoảng trắng lạ) nhưng strptime vẫn đọc được
+            dt = datetime.strptime(raw, self.fmt)
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc if "%Z" in self.fmt else self.tz)
+            result = dt.strftime(OUTPUT_FORMAT), int(dt.timestamp())
+        return result
+
+    def _from_match(self, m: re.Match):
+        g = m.groupdict()
+
+        year = g.get("Y")
+        if year:
+            year = int(year)
+        else:
+            # như strptime %y: 69-99 -> 19xx, 00-68 -> 20xx
+            year = int(g["y"])
+            year += 1900 if year >= 69 else 2000
+
+        month = g.get("b")
+        if month:
+            month = MONTHS.get(month.lower())
+            if month is None:
+                return None
+        else:
+            month = int(g["m"])
+
+        if g.get("z"):
+            offset = offset_seconds(g["z"])
+        elif g.get("Z"):
+            offset = 0
+        else:
+            offset = self.offset
+
+        day, hour, minute, second = int(g["d"]), int(g.get("H") or 0), int(g.get("M") or 0), int(g.get("S") or 0)
+        try:
+            # datetime(...) chỉ để kiểm tra ngày hợp lệ + tính số giây từ epoch
+            local = datetime(year, month, day, hour, minute, second)
+        except ValueError:
+            return None
+
+        ts = (local - EPOCH) // SECOND - offset
+        return f"{year:04d}/{month:02d}/{day:02d} {hour:02d}:{minute:02d}:{second:02d}", ts
+
+
+# --- format của các nguồn ---
+RFC822 = DateFormat("%a, %d %b %Y %H:%M:%S %z")       # vst, ktck: Mon, 12 Jan 2026 13:19:00 +0700
+RFC822_GMT = DateFormat("%a, %d %b %Y %H:%M:%S %Z")   # vne: Mon, 12 Jan 2026 07:02:17 GMT
+TBKT = DateFormat("%H:%M %d/%m/%Y")                   # 18:34 12/01/2026
+VNFI = DateFormat("%d/%m/%y %H:%M")                   # 12/01/26 13:43 (phần trước "(GMT+7)")
+NQS = DateFormat("%d/%m/%Y - %H:%M")                  # 12/01/2026 - 09:57
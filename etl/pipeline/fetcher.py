@@ -0,0 +1,127 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# --- Cấu hình mặc định ---
+MAX_WORKERS = 16        # số thread tối đa của pool
+PER_HOST_LIMIT = 6      # số request đồng thời tối đa trên 1 host
+RATE_LIMIT = 20.0       # request / giây, toàn cục cho mọi host
+DEFAULT_TIMEOUT = 15
+
+
+class RateLimiter:
+    """
+    Token bucket đơn giản, dùng chung cho mọi thread
+    - rate <= 0: không giới hạn
+    """
+
+    def __init__(self, rate: float, burst: int = None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class Fetcher:
+    """
+    Lớp fetch dùng chung cho mọi extractor
+    - bounded thread pool: các host chạy song song
+    - giới hạn đồng thời theo từng host + rate limit toàn cục
+    - 1 Session duy nhất -> connection keep-alive được tái sử dụng
+    """
+
+    def __init__(
+        self,
+        headers: dict = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_workers: int = MAX_WORKERS,
+        per_host: int = PER_HOST_LIMIT,
+        rate: float = RATE_LIMIT,
+    ):
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self.per_host = per_host
+        self.limiter = RateLimiter(rate)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=per_host)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._host_slots = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+        self.session.close()
+
+    def _slot(self, url: str) -> threading.Semaphore:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_slots[host]
+
+    def get(self, url: str, headers: dict = None, timeout: float = None) -> requests.Response:
+        """
+        GET 1 URL (thread-safe), tôn trọng giới hạn host + rate limit
+        """
+        merged = dict(self.headers)
+        if headers:
+            merged.update(headers)
+
+        with self._slot(url):
+            self.limiter.acquire()
+            return self.session.get(url, headers=merged, timeout=timeout or self.timeout)
+
+    def map(self, func, items) -> list:
+        """
+        Chạy func(item) song song trên pool, trả kết quả theo đúng thứ tự items.
+        Exception đầu tiên (theo thứ tự) được raise lại.
+        Lưu ý: func không được gọi lại map/fetch_all của cùng Fetcher (tránh deadlock pool).
+        """
+        futures = [self._pool.submit(func, item) for item in items]
+        return [f.result() for f in futures]
+
+    def fetch_all(self, urls, **kwargs) -> list:
+        """
+        GET nhiều URL song song.
+        Trả list cùng thứ tự urls, mỗi phần tử là Response hoặc Exception.
+        """
+        def _get(url):
+            try:
+                return self.get(url, **kwargs)
+            except Exception as e:
+                return e
+
+        return self.map(_get, urls)
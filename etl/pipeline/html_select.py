@@ -0,0 +1,31 @@
+"""
+Parse HTML bằng lxml cho các nguồn HTML (tbkt, vnfi)
+- XPath biên dịch 1 lần lúc import (etree.XPath), dùng lại cho mọi page
+- parser C của lxml, thay cho BeautifulSoup "html.parser" (thuần Python)
+"""
+from lxml import etree, html
+
+# các trang nguồn đều UTF-8; cố định encoding để không phụ thuộc thẻ meta
+PARSER = html.HTMLParser(encoding="utf-8")
+
+
+def parse(content: bytes):
+    return html.fromstring(content, parser=PARSER)
+
+
+def xpath(expr: str) -> etree.XPath:
+    return etree.XPath(expr)
+
+
+def has_class(name: str) -> str:
+    """
+    Điều kiện XPath tương đương CSS .name (khớp 1 token trong @class)
+    """
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def text_of(el) -> str:
+    """
+    Giống BeautifulSoup get_text(strip=True): strip từng đoạn text rồi nối lại
+    """
+    return "".join(t.strip() for t in el.itertext())
@@ -0,0 +1,152 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+from .fetcher import Fetcher
+
+CACHE_DIR = ".cache/http"
+INDEX_FILE = "index.json"
+PENDING_DIR = ".tmp"
+MAX_AGE = 7 * 86400  # giây, entry không được dùng lâu hơn (feed đã bỏ khỏi cấu hình) bị xoá
+
+
+class HttpCache:
+    """
+    Cache HTTP có điều kiện, key theo URL, chỉ lưu index.json (không lưu body)
+    - lưu ETag / Last-Modified + hash body của lần fetch trước
+    - gửi If-None-Match / If-Modified-Since
+    - 304 hoặc body không đổi -> coi như hit, caller bỏ qua parse/transform
+    - entry mới chỉ nằm trong pending, commit vào index.json sau khi load thành công
+      (giống watermark): transform / load lỗi thì lần sau vẫn fetch lại feed
+    - evict entry không được dùng quá MAX_AGE: index chỉ giữ các feed đang cấu hình của nguồn
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR, max_age: float = MAX_AGE):
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        self.index_path = os.path.join(cache_dir, INDEX_FILE)
+        self.hits = 0
+        self.misses = 0
+        self.pending = {}  # url -> entry mới của lần chạy này, chưa commit
+        self._lock = threading.Lock()
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.index = {}
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    self.index = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                print(f"[WARN] Cache index lỗi, bỏ qua: {self.index_path}")
+
+    def conditional_headers(self, url: str) -> dict:
+        with self._lock:
+            entry = self.index.get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def fetch(self, fetcher: Fetcher, url: str, headers: dict = None, timeout: float = None):
+        """
+        GET có điều kiện.
+        Trả về body (bytes) nếu nội dung mới, None nếu không đổi (304 / cùng hash).
+        """
+        merged = dict(headers or {})
+        merged.update(self.conditional_headers(url))
+        resp = fetcher.get(url, headers=merged, timeout=timeout)
+
+        if resp.status_code == 304:
+            with self._lock:
+                self.hits += 1
+                if url in self.index:
+                    self.pending[url] = {**self.index[url], "used": time.time()}
+            return None
+
+        resp.raise_for_status()
+
+        body = resp.content
+        body_hash = hashlib.sha1(body).hexdigest()
+
+        with self._lock:
+            entry = self.index.get(url)
+            unchanged = entry is not None and entry.get("body_hash") == body_hash
+
+            if unchanged:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+            self.pending[url] = {
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "body_hash": body_hash,
+                "used": time.time(),
+            }
+
+        return None if unchanged else body
+
+    def _evict(self):
+        cutoff = time.time() - self.max_age
+        for url in [u for u, e in self.index.items() if e.get("used", 0) < cutoff]:
+            del self.index[url]
+
+    def commit(self, entries: dict):
+        """
+        Ghi entry đã staged (sau khi load thành công) vào index.json
+        """
+        with self._lock:
+            self.index.update(entries)
+        self.save()
+
+    def save(self):
+        with self._lock:
+            self._evict()
+            tmp_path = self.index_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.index, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+
+    def report(self, name: str):
+        total = self.hits + self.misses
+        print(f"[CACHE] {name}: {self.hits} hit / {self.misses} miss ({total} feeds)")
+
+
+# ---------- entry chờ commit, cùng vòng đời với .tmp/watermarks_<src>.json ----------
+
+def _pending_path(source: str) -> str:
+    return os.path.join(PENDING_DIR, f"http_cache_{source}.json")
+
+
+def save_pending(source: str, entries: dict):
+    """
+    Extract ghi entry cache mới ra .tmp, chỉ được commit sau khi load thành công
+    """
+    if not entries:
+        return
+
+    os.makedirs(PENDING_DIR, exist_ok=True)
+    with open(_pending_path(source), "w", encoding="utf-8") as f:
+        json.dump(entries, f, ensure_ascii=False)
+
+
+def read_pending(source: str) -> dict:
+    path = _pending_path(source)
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def clear_pending(source: str):
+    path = _pending_path(source)
+    if os.path.exists(path):
+        os.remove(path)
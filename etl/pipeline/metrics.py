@@ -0,0 +1,215 @@
+"""
+Đo từng stage của ETL: thời gian, bytes fetch, record vào / ra, bản trùng bỏ qua, dòng insert.
+
+Mỗi stage (nguồn, extract / transform / load / merge) ghi 1 bản ghi:
+- 1 dòng JSON vào logs/etl_runs.jsonl ở gốc dự án (và in ra log với tiền tố [METRIC])
+- 1 dòng vào bảng etl_runs của db/etl_metrics.db để query xu hướng
+
+Các stage cùng 1 lần chạy DAG chung run_id (ETL_RUN_ID, hoặc run id Airflow truyền qua env).
+Xem nhanh: python3 -m pipeline.metrics [--days 7]
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from .base import DB_DIR
+
+METRICS_DB = os.environ.get("ETL_METRICS_DB", os.path.join(DB_DIR, "etl_metrics.db"))
+METRICS_LOG = os.path.join(DB_DIR, "..", "logs", "etl_runs.jsonl")
+RUNS_TABLE = "etl_runs"
+BUSY_TIMEOUT = 30
+
+COUNTERS = ("bytes_fetched", "requests", "records_in", "records_out", "duplicates", "inserted", "quarantined",
+            "clustered")
+
+RUN_ID = (
+    os.environ.get("ETL_RUN_ID")
+    or os.environ.get("AIRFLOW_CTX_DAG_RUN_ID")
+    or f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+)
+
+_write_lock = threading.Lock()
+
+
+class StageMetrics:
+    """
+    Counter của 1 stage, cộng dồn thread-safe (extract chạy song song trong pool)
+    """
+
+    def __init__(self, source: str, stage: str):
+        self.source = source
+        self.stage = stage
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.seconds = 0.0
+        self.error = None
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self._lock = threading.Lock()
+
+    def add(self, key: str, n: int = 1):
+        with self._lock:
+            self.counters[key] += n
+
+    def set(self, key: str, n: int):
+        with self._lock:
+            self.counters[key] = n
+
+    def as_dict(self) -> dict:
+        return {
+            "run_id": RUN_ID,
+            "source": self.source,
+            "stage": self.stage,
+            "started_at": self.started_at,
+            "seconds": round(self.seconds, 3),
+            **self.counters,
+            "error": self.error,
+        }
+
+
+class CountingFetcher:
+    """
+    Bọc Fetcher dùng chung, đếm request + bytes của 1 nguồn (Fetcher có thể chia giữa nhiều nguồn)
+    """
+
+    def __init__(self, fetcher, metrics: StageMetrics):
+        self._fetcher = fetcher
+        self._metrics = metrics
+
+    def get(self, url: str, **kwargs):
+        resp = self._fetcher.get(url, **kwargs)
+        self._metrics.add("requests")
+        self._metrics.add("bytes_fetched", len(resp.content))
+        return resp
+
+    def __getattr__(self, name):
+        return getattr(self._fetcher, name)
+
+
+@contextmanager
+def stage(source: str, name: str):
+    """
+    with stage("vst", "load") as m: ... m.add("inserted", n)
+    Ghi metric khi ra khỏi block, kể cả khi lỗi (exception vẫn được raise lại)
+    """
+    m = StageMetrics(source, name)
+    t0 = time.perf_counter()
+    try:
+        yield m
+    except Exception as e:
+        m.error = str(e) or type(e).__name__
+        raise
+    finally:
+        m.seconds = time.perf_counter() - t0
+        record(m)
+
+
+def ensure_runs_table(conn: sqlite3.Connection):
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {RUNS_TABLE} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id TEXT NOT NULL,
+            source TEXT NOT NULL,
+            stage TEXT NOT NULL,
+            started_at TEXT NOT NULL,
+            seconds REAL NOT NULL,
+            bytes_fetched INTEGER NOT NULL DEFAULT 0,
+            requests INTEGER NOT NULL DEFAULT 0,
+            records_in INTEGER NOT NULL DEFAULT 0,
+            records_out INTEGER NOT NULL DEFAULT 0,
+            duplicates INTEGER NOT NULL DEFAULT 0,
+            inserted INTEGER NOT NULL DEFAULT 0,
+            error TEXT
+        )
+    """)
+    # bảng tạo trước khi có counter mới -> thêm cột
+    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({RUNS_TABLE})")}
+    for name in COUNTERS:
+        if name not in columns:
+            conn.execute(f"ALTER TABLE {RUNS_TABLE} ADD COLUMN {name} INTEGER NOT NULL DEFAULT 0")
+    conn.execute(f"""
+        CREATE INDEX IF NOT EXISTS idx_{RUNS_TABLE}_stage_time
+        ON {RUNS_TABLE} (source, stage, started_at)
+    """)
+
+
+def record(m: StageMetrics):
+    """
+    Ghi JSON line + bảng etl_runs. Lỗi ghi metric chỉ cảnh báo, không làm hỏng pipeline.
+    """
+    row = m.as_dict()
+    line = json.dumps(row, ensure_ascii=False, separators=(",", ":"))
+    # 1 lần write: không bị chen giữa bởi log của thread khác
+    sys.stdout.write(f"[METRIC] {line}\n")
+
+    with _write_lock:
+        try:
+            os.makedirs(os.path.dirname(METRICS_LOG), exist_ok=True)
+            with open(METRICS_LOG, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            print(f"[WARN] Cannot write {METRICS_LOG}: {e}")
+
+        try:
+            conn = sqlite3.connect(METRICS_DB, timeout=BUSY_TIMEOUT)
+            try:
+                # WAL: các nguồn chạy song song ghi cùng lúc không khoá lẫn nhau (lưu trong file DB)
+                conn.execute("PRAGMA journal_mode=WAL")
+                with conn:
+                    # giữ write lock từ đầu: kiểm tra cột + ALTER không bị process khác chen giữa
+                    conn.execute("BEGIN IMMEDIATE")
+                    ensure_runs_table(conn)
+                    cols = list(row)
+                    conn.execute(
+                        f"INSERT INTO {RUNS_TABLE} ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))})",
+                        [row[c] for c in cols]
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"[WARN] Cannot write {METRICS_DB}: {e}")
+
+
+# ---------- xem xu hướng ----------
+
+TREND_SQL = f"""
+    SELECT source, stage, COUNT(*), AVG(seconds), MAX(seconds),
+           AVG(bytes_fetched), AVG(records_out), AVG(inserted), SUM(error IS NOT NULL)
+    FROM {RUNS_TABLE}
+    WHERE started_at >= datetime('now', 'localtime', ?)
+    GROUP BY source, stage
+    ORDER BY AVG(seconds) DESC
+"""
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python3 -m pipeline.metrics",
+        description="Thời gian trung bình từng stage / nguồn"
+    )
+    parser.add_argument("--days", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(METRICS_DB):
+        print(f"[WARN] Missing {METRICS_DB}")
+        return
+
+    conn = sqlite3.connect(METRICS_DB)
+    try:
+        rows = conn.execute(TREND_SQL, (f"-{args.days} days",)).fetchall()
+    finally:
+        conn.close()
+
+    print(f"{'source':<12} {'stage':<10} {'runs':>5} {'avg s':>8} {'max s':>8} "
+          f"{'avg KB':>8} {'avg out':>8} {'avg ins':>8} {'errors':>6}")
+    for source, stage_name, runs, avg_s, max_s, avg_bytes, avg_out, avg_ins, errors in rows:
+        print(f"{source:<12} {stage_name:<10} {runs:>5} {avg_s:>8.2f} {max_s:>8.2f} "
+              f"{avg_bytes / 1024:>8.0f} {avg_out:>8.0f} {avg_ins:>8.0f} {errors:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import json
+
+
+class NdjsonWriter:
+    """
+    Ghi newline-delimited JSON: mỗi record 1 dòng, append theo batch
+    - không đọc lại / ghi lại toàn bộ file -> I/O tỉ lệ với dữ liệu mới
+    """
+
+    def __init__(self, path: str, mode: str = "w"):
+        self.path = path
+        self.count = 0
+        self._f = open(path, mode, encoding="utf-8")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write_many(self, items):
+        for item in items:
+            self._f.write(json.dumps(item, ensure_ascii=False, separators=(",", ":")))
+            self._f.write("\n")
+            self.count += 1
+        self._f.flush()
+
+    def close(self):
+        self._f.close()
+
+
+def iter_ndjson(path: str):
+    """
+    Đọc lazy từng record, bỏ qua dòng lỗi (vd. dòng cuối ghi dở)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                print(f"Skip JSON error line {line_no} in {path}")
@@ -0,0 +1,114 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .fetcher import Fetcher
+from .sources import SOURCES, get_source
+from .stages import run_source
+
+PARSE_WORKERS = min(4, os.cpu_count() or 1)  # process parse HTML (tbkt, vnfi) khi --parallel
+
+
+def run_one(source, fetcher: Fetcher, backfill: bool = False, parse_pool=None) -> dict:
+    """
+    Chạy 1 nguồn, không raise: {"seconds", "inserted", "error"}
+    """
+    print(f"\n[START] {source.name}")
+    t0 = time.perf_counter()
+    inserted, error = 0, None
+    try:
+        inserted = run_source(source, fetcher, backfill=backfill, parse_pool=parse_pool)
+    except Exception as e:
+        print(f"[ERROR] {source.name} failed: {e}")
+        error = str(e)
+    return {"seconds": time.perf_counter() - t0, "inserted": inserted, "error": error}
+
+
+def run(names=None, backfill: bool = False, total: bool = True,
+        parallel: bool = False, parse_workers: int = PARSE_WORKERS) -> dict:
+    """
+    Chạy extract -> transform -> load cho các nguồn trong 1 interpreter,
+    record truyền trong RAM (không qua .tmp / data json).
+    - parallel: các nguồn chạy đồng thời (mỗi nguồn 1 thread, fetch dùng chung pool của Fetcher),
+      nguồn parse_in_pool parse trong process pool
+    Trả về {nguồn: {"seconds", "inserted", "error"}}, kèm "_total_load" nếu total.
+    """
+    sources = [get_source(n) for n in names] if names else list(SOURCES.values())
+    report = {}
+
+    parse_pool = None
+    if parallel and parse_workers > 0 and any(s.parse_in_pool for s in sources):
+        parse_pool = ProcessPoolExecutor(max_workers=parse_workers)
+        # khởi động worker ngay, trước khi có thread fetch (fork khi process còn 1 thread)
+        parse_pool.submit(os.getpid).result()
+
+    try:
+        # 1 Fetcher dùng chung -> connection pool dùng lại giữa các nguồn
+        with Fetcher() as fetcher:
+            if parallel:
+                # thread riêng cho từng nguồn: Fetcher.map không được gọi lồng trong pool của nó
+                with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+                    futures = {
+                        s.name: pool.submit(run_one, s, fetcher, backfill, parse_pool) for s in sources
+                    }
+                report = {name: f.result() for name, f in futures.items()}
+            else:
+                for source in sources:
+                    report[source.name] = run_one(source, fetcher, backfill)
+    finally:
+        if parse_pool is not None:
+            parse_pool.shutdown()
+
+    if total:
+        import _total_load
+        t0 = time.perf_counter()
+        error = None
+        try:
+            _total_load.main()
+        except Exception as e:
+            print(f"[ERROR] _total_load failed: {e}")
+            error = str(e)
+        report["_total_load"] = {"seconds": time.perf_counter() - t0, "inserted": None, "error": error}
+
+    return report
+
+
+def print_report(report: dict):
+    for name, r in report.items():
+        inserted = "" if r["inserted"] is None else f", inserted {r['inserted']}"
+        status = f", FAILED: {r['error']}" if r["error"] else ""
+        print(f"[TIME] {name:<12} {r['seconds']:7.2f}s{inserted}{status}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python3 -m pipeline",
+        description="Chạy toàn bộ ETL trong 1 process"
+    )
+    parser.add_argument("sources", nargs="*", help=f"mặc định: tất cả ({', '.join(SOURCES)})")
+    parser.add_argument("--backfill", action="store_true", help="bỏ qua watermark, crawl sâu lịch sử")
+    parser.add_argument("--no-total", action="store_true", help="không chạy _total_load sau cùng")
+    parser.add_argument("--parallel", action="store_true",
+                        help="chạy các nguồn đồng thời, parse HTML (tbkt, vnfi) trong process pool")
+    parser.add_argument("--parse-workers", type=int, default=PARSE_WORKERS,
+                        help=f"số process parse khi --parallel (mặc định {PARSE_WORKERS}, 0 = parse tại chỗ)")
+    args = parser.parse_args(argv)
+
+    unknown = [n for n in args.sources if n not in SOURCES]
+    if unknown:
+        parser.error(f"unknown source: {', '.join(unknown)}")
+
+    report = run(
+        args.sources, backfill=args.backfill, total=not args.no_total,
+        parallel=args.parallel, parse_workers=args.parse_workers
+    )
+    print_report(report)
+
+    failed = [name for name, r in report.items() if r["error"]]
+    if failed:
+        print(f"[DONE] Failed: {', '.join(failed)}")
+        sys.exit(1)
+
+    print("[DONE] Pipeline completed")
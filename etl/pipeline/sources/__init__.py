@@ -0,0 +1,25 @@
+from .ktck import KinhTeChungKhoan
+from .nqs import NguoiQuanSat
+from .tbkt import ThoiBaoKinhTe
+from .vne import VnEconomy
+from .vnfi import VietNamFinance
+from .vst import VietStock
+
+# Thêm nguồn mới: viết 1 plugin Source rồi đăng ký vào đây
+SOURCES = {
+    src.name: src
+    for src in (
+        VietStock(),
+        VietNamFinance(),
+        VnEconomy(),
+        ThoiBaoKinhTe(),
+        NguoiQuanSat(),
+        KinhTeChungKhoan(),
+    )
+}
+
+
+def get_source(name: str):
+    if name not in SOURCES:
+        raise KeyError(f"Unknown source: {name} (có: {', '.join(SOURCES)})")
+    return SOURCES[name]
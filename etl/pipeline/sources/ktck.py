@@ -0,0 +1,37 @@
+from .. import dates
+from ..base import RssSource
+
+SPECS = [
+    {
+        "url": "https://kinhtechungkhoan.vn/rss/tai-chinh",
+        "category": "tai-chinh-ngan-hang"
+    },
+    {
+        "url": "https://kinhtechungkhoan.vn/rss/tai-chinh/ngan-hang",
+        "category": "tai-chinh-ngan-hang"
+    },
+    {
+        "url": "https://kinhtechungkhoan.vn/rss/chung-khoan",
+        "category": "chung-khoan"
+    },
+    {
+        "url": "https://kinhtechungkhoan.vn/rss/vi-mo",
+        "category": "vi-mo"
+    }
+]
+
+
+class KinhTeChungKhoan(RssSource):
+    name = "ktck"
+    display_name = "KinhTeChungKhoan"
+    specs = SPECS
+    timeout = 10
+
+    def parse_date(self, raw: str):
+        """
+        Input : Mon, 12 Jan 2026 10:20:01 +0700
+        Output:
+            - formatted: yyyy/mm/dd hh:mm:ss
+            - unix ts
+        """
+        return dates.RFC822.parse(raw)
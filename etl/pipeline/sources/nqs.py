@@ -0,0 +1,185 @@
+import re
+import sqlite3
+from datetime import datetime
+
+from lxml import html
+
+from .. import dates, text
+from ..base import ExtractContext, Source
+
+# --- Cấu hình ---
+START_URL = "https://nguoiquansat.vn/tin-moi-nhat"
+API_TEMPLATE = "https://nguoiquansat.vn/api/getMoreArticle/channel_empty_{PublisherId}_{ChannelId}_0"
+LINK_XPATH = '/html/body/div[3]/div/div/div[1]/div[2]/div[1]/div/div/div[1]/a'
+LOOP_COUNT = 10
+BACKFILL_LOOP_COUNT = 200  # --backfill: bỏ qua watermark, crawl tới khi API trả rỗng
+
+# chỉ xử lý các channel này
+CATEGORY_MAP = {
+    302: "chung-khoan",
+    310: "bat-dong-san",
+    315: "tai-chinh-ngan-hang",
+    372: "vi-mo",
+}
+
+
+class NguoiQuanSat(Source):
+    name = "nqs"
+    display_name = "NguoiQuanSat"
+    timeout = 10
+    paginated = True
+    require_date = False
+    dedup_index = ("idx_articles_hash_title", "href_hash, title_latin")
+
+    # ---------- extract ----------
+
+    def extract(self, ctx: ExtractContext):
+        # --- Bước 1: lấy PublisherId mới nhất từ trang tin mới ---
+        resp = ctx.fetcher.get(START_URL, timeout=self.timeout)
+        resp.raise_for_status()
+
+        tree = html.fromstring(resp.content)
+        link_elem = tree.xpath(LINK_XPATH)
+        if not link_elem:
+            raise ValueError("Không tìm thấy link tại XPath đã cho")
+        link_href = link_elem[0].get("href")
+
+        match = re.search(r'(\d{6})\.html$', link_href)
+        if not match:
+            raise ValueError("Không tìm thấy PublisherId trong link")
+        publisher_id = match.group(1)
+        print(f"Initial PublisherId: {publisher_id}")
+
+        # --- Bước 2: duyệt song song từng ChannelId ---
+        ctx.fetcher.map(
+            lambda channel_id: self.crawl_channel(ctx, channel_id, publisher_id),
+            list(CATEGORY_MAP)
+        )
+
+    def crawl_channel(self, ctx: ExtractContext, channel_id: int, publisher_id: str):
+        current_publisher_id = publisher_id  # reset cho mỗi channel
+        watermark = ctx.watermarks.get(str(channel_id))
+        newest_id = watermark or 0
+        loop_count = BACKFILL_LOOP_COUNT if ctx.backfill else LOOP_COUNT
+        failed = False
+
+        # Các page trong 1 channel phải tuần tự (page sau cần PublisherId của page trước)
+        for i in range(loop_count):
+            api_url = API_TEMPLATE.format(PublisherId=current_publisher_id, ChannelId=channel_id)
+            print(f"[{channel_id}][{i+1}/{loop_count}] Fetching API: {api_url}")
+            try:
+                resp = ctx.fetcher.get(api_url, timeout=self.timeout)
+                resp.raise_for_status()
+                data = resp.json()
+            except Exception as e:
+                print(f"API không truy cập được hoặc lỗi: {e}. Dừng crawl channel {channel_id}.")
+                failed = True
+                break
+
+            # Kiểm tra data có phải list và có dữ liệu không
+            if not isinstance(data, list) or not data:
+                print(f"API trả về rỗng hoặc không phải list. Dừng crawl channel {channel_id}.")
+                break
+
+            # --- Sắp xếp PublisherId giảm dần ---
+            sorted_data = sorted(data, key=lambda x: int(x.get("PublisherId", 0)), reverse=True)
+
+            # --- Lấy PublisherId nhỏ nhất làm last PublisherId ---
+            last_publisher_id = str(min(int(item.get("PublisherId", 0)) for item in sorted_data))
+            current_publisher_id = last_publisher_id
+
+            ctx.emit(str(channel_id), [self.to_raw(item, channel_id) for item in sorted_data])
+
+            newest_id = max(newest_id, int(sorted_data[0].get("PublisherId", 0)))
+
+            # PublisherId giảm dần: page đã chạm watermark -> các page sau đều cũ hơn
+            if watermark is not None and int(last_publisher_id) <= watermark:
+                print(f"Reached watermark {watermark} for channel {channel_id}. Stop.")
+                break
+
+        # page lỗi giữa chừng: giữ watermark cũ, lần sau crawl lại các page chưa lấy được
+        if failed:
+            print(f"[WARN] Channel {channel_id} paging failed, keep watermark {watermark}")
+        elif newest_id:
+            ctx.set_watermark(str(channel_id), newest_id)
+
+    @staticmethod
+    def to_raw(item: dict, channel_id: int) -> dict:
+        """
+        Object API -> raw record chuẩn (category ép theo channel đang xử lý)
+        """
+        return {
+            "title": item.get("Title") or "",
+            "href": item.get("LinktoMe2") or "",
+            "category": CATEGORY_MAP.get(channel_id),
+            "publish_date": item.get("TimeX1") or "",
+        }
+
+    # ---------- transform ----------
+
+    def parse_date(self, raw: str):
+        """
+        Input:  "12/01/2026 - 09:57"
+        Output: ("2026/01/12 09:57:00", unix_ts)
+        """
+        if not raw:
+            return None, None
+
+        try:
+            return dates.NQS.parse(raw)
+        except ValueError:
+            return None, None
+
+    def latinize(self, title: str) -> str:
+        return text.normalize_title_latin(title)
+
+    def normalize_url(self, url: str) -> str:
+        return text.canonicalize_url(url)
+
+    def latinize_many(self, titles: list) -> list:
+        return text.normalize_title_latin_many(titles)
+
+    def normalize_urls(self, urls: list) -> list:
+        return [text.canonicalize_url(u) for u in urls]
+
+    # ---------- load ----------
+
+    def ensure_schema(self, conn: sqlite3.Connection):
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT,
+            title_latin TEXT,
+            href TEXT,
+            href_hash BLOB,
+            publish_date TEXT,
+            publish_ts INTEGER,
+            category TEXT
+        )
+        """)
+
+        # unique index cho dedup
+        conn.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_hash_title
+        ON articles (href_hash, title_latin)
+        """)
+
+        conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_articles_publish_ts
+        ON articles(publish_ts)
+        """)
+
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS categories (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT UNIQUE,
+            created_at TEXT
+        )
+        """)
+
+    def insert_categories(self, conn: sqlite3.Connection, categories):
+        now = datetime.utcnow().isoformat()
+        conn.executemany(
+            "INSERT OR IGNORE INTO categories (name, created_at) VALUES (?, ?)",
+            [(c, now) for c in categories]
+        )
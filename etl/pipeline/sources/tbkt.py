@@ -0,0 +1,148 @@
+from .. import dates, html_select
+from ..base import BROWSER_HEADERS, ExtractContext, Source
+
+SPECS = [
+    {
+        "channel": "tai-chinh",
+        "url": "https://thoibaotaichinhvietnam.vn/tai-chinh&s_cond=&BRSR={count}",
+        "category": "tai-chinh-ngan-hang"
+    },
+    {
+        "channel": "ngan-hang",
+        "url": "https://thoibaotaichinhvietnam.vn/ngan-hang&s_cond=&BRSR={count}",
+        "category": "tai-chinh-ngan-hang"
+    },
+    {
+        "channel": "chung-khoan",
+        "url": "https://thoibaotaichinhvietnam.vn/chung-khoan&s_cond=&BRSR={count}",
+        "category": "chung-khoan"
+    },
+    {
+        "channel": "bat-dong-san",
+        "url": "https://thoibaotaichinhvietnam.vn/bat-dong-san&s_cond=&BRSR={count}",
+        "category": "bat-dong-san"
+    },
+    {
+        "channel": "kinh-te",
+        "url": "https://thoibaotaichinhvietnam.vn/kinh-te&s_cond=&BRSR={count}",
+        "category": "vi-mo"
+    }
+]
+
+COUNTS = [0, 15, 30, 45, 60]
+PAGE_SIZE = 15
+BACKFILL_PAGES = 100  # --backfill: bỏ qua watermark, crawl tới khi hết bài
+
+ARTICLES = html_select.xpath("//article[@class='article']")
+# 1 query / article: link tiêu đề + giờ + ngày đăng
+ARTICLE_FIELDS = html_select.xpath(
+    ".//h3[@class='article-title']/a"
+    " | .//span[@class='article-publish-time']//span[@class='format_time' or @class='format_date']"
+)
+
+
+class ThoiBaoKinhTe(Source):
+    name = "tbkt"
+    display_name = "ThoiBaoKinhTe"
+    specs = SPECS
+    headers = BROWSER_HEADERS
+    timeout = 15
+    paginated = True
+    parse_in_pool = True
+
+    # ---------- extract ----------
+
+    def extract_spec(self, ctx: ExtractContext, spec: dict):
+        """
+        Crawl tuần tự các page của 1 channel, dừng khi page đã chạm watermark
+        """
+        watermark = ctx.watermarks.get(spec["channel"])
+        counts = range(0, BACKFILL_PAGES * PAGE_SIZE, PAGE_SIZE) if ctx.backfill else COUNTS
+        newest_ts = watermark or 0
+        failed = False
+
+        for count in counts:
+            url = spec["url"].format(count=count)
+            print(f"[INFO] Fetching: {url}")
+            try:
+                page = ctx.parse(self, self.fetch(ctx, url), spec)
+            except Exception as e:
+                print(f"[ERROR] Failed to fetch {url}: {e}")
+                failed = True
+                continue
+
+            if not page:
+                if ctx.backfill:
+                    break
+                continue
+
+            ctx.emit(spec["category"], page)
+
+            # ngày lỗi không tính (transform đưa bản ghi đó vào quarantine), tránh 1 bài lỗi làm dừng sớm
+            page_ts = [ts for ts in (self.publish_ts(r["publish_date"]) for r in page) if ts is not None]
+            if not page_ts:
+                continue
+            newest_ts = max(newest_ts, max(page_ts))
+
+            # bài sắp xếp mới -> cũ: page có bài cũ hơn watermark -> các page sau đều đã có
+            if watermark is not None and min(page_ts) < watermark:
+                print(f"[INFO] Reached watermark for {spec['channel']} at BRSR={count}, stop paging")
+                break
+
+        # page lỗi giữa chừng: giữ watermark cũ, lần sau crawl lại các page chưa lấy được
+        if failed:
+            print(f"[WARN] Paging {spec['channel']} failed, keep watermark {watermark}")
+        elif newest_ts:
+            ctx.set_watermark(spec["channel"], newest_ts)
+
+    def parse(self, content: bytes, spec: dict) -> list:
+        category = spec["category"]
+        tree = html_select.parse(content)
+        records = []
+
+        articles = ARTICLES(tree)
+        print(f"[INFO] Found {len(articles)} articles")
+
+        for idx, article in enumerate(articles, start=1):
+            # node đầu tiên có text của mỗi loại: "a" (title & href), "format_time", "format_date"
+            fields = {}
+            for node in ARTICLE_FIELDS(article):
+                if node.text is not None:
+                    fields.setdefault("a" if node.tag == "a" else node.get("class"), node)
+
+            link = fields.get("a")
+            time_node = fields.get("format_time")
+            date_node = fields.get("format_date")
+
+            if link is None or not link.get("href") or time_node is None or date_node is None:
+                print(f"[WARN] Skip article #{idx} (missing field)")
+                continue
+
+            records.append({
+                "title": link.text.strip(),
+                "href": link.get("href").strip(),
+                "category": category,
+                "publish_date": f"{time_node.text.strip()} {date_node.text.strip()}"
+            })
+
+        return records
+
+    def publish_ts(self, raw: str):
+        """
+        ts dùng so với watermark, None nếu không parse được
+        """
+        try:
+            return self.parse_date(raw)[1]
+        except ValueError:
+            return None
+
+    # ---------- transform ----------
+
+    def parse_date(self, raw: str):
+        """
+        Input : "18:34 12/01/2026"
+        Output:
+            - formatted: yyyy/mm/dd hh:mm:ss
+            - unix ts (UTC+7)
+        """
+        return dates.TBKT.parse(raw)
@@ -0,0 +1,72 @@
+import sqlite3
+
+from .. import dates
+from ..base import RssSource
+
+SPECS = [
+    {
+        "url": "https://vneconomy.vn/chung-khoan.rss",
+        "category": "chung-khoan"
+    },
+    {
+        "url": "https://vneconomy.vn/tai-chinh.rss",
+        "category": "tai-chinh-ngan-hang"
+    },
+    {
+        "url": "https://vneconomy.vn/dau-tu.rss",
+        "category": "tai-chinh-ngan-hang"
+    },
+    {
+        "url": "https://vneconomy.vn/dia-oc.rss",
+        "category": "bat-dong-san"
+    }
+]
+
+# publish_ts tính từ publish_date (giữ nguyên giờ GMT của feed)
+UTC_TS_SQL = "CAST(strftime('%s', replace(publish_date, '/', '-')) AS INTEGER)"
+UTC_TS_VERSION = 1  # PRAGMA user_version của DB khi publish_ts các tin cũ đã tính lại theo UTC
+
+
+def fix_publish_ts(conn: sqlite3.Connection, where: str = "1=1", params=()) -> int:
+    """
+    Tin nạp trước pipeline/dates.py: giờ GMT bị hiểu theo timezone của máy chạy
+    (máy UTC+7 -> publish_ts sớm 7 tiếng). Tính lại publish_ts từ publish_date, trả về số dòng đã sửa.
+    """
+    return conn.execute(f"""
+        UPDATE articles SET publish_ts = {UTC_TS_SQL}
+        WHERE {where} AND {UTC_TS_SQL} IS NOT NULL AND publish_ts IS NOT {UTC_TS_SQL}
+    """, params).rowcount
+
+
+def migrate_utc_ts(conn: sqlite3.Connection) -> int:
+    """
+    Migration 1 lần cho db/vne.db, đánh dấu bằng PRAGMA user_version
+    """
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= UTC_TS_VERSION:
+        return 0
+
+    fixed = fix_publish_ts(conn)
+    conn.execute(f"PRAGMA user_version = {UTC_TS_VERSION}")
+    if fixed:
+        print(f"[MIGRATE] vne: recomputed publish_ts of {fixed} articles as UTC")
+    return fixed
+
+
+class VnEconomy(RssSource):
+    name = "vne"
+    display_name = "VnEconomy"
+    specs = SPECS
+    timeout = 10
+
+    def parse_date(self, raw: str):
+        """
+        Input : Mon, 12 Jan 2026 07:02:17 GMT
+        Output:
+            - formatted: yyyy/mm/dd hh:mm:ss
+            - unix ts
+        """
+        return dates.RFC822_GMT.parse(raw)
+
+    def ensure_schema(self, conn: sqlite3.Connection):
+        super().ensure_schema(conn)
+        migrate_utc_ts(conn)
@@ -0,0 +1,71 @@
+from .. import dates, html_select
+from ..base import BROWSER_HEADERS, Source
+
+# --- 6 link cố định ---
+SPECS = [
+    {"url": "https://vietnamfinance.vn/tai-chinh/", "category": "tai-chinh-ngan-hang"},
+    {"url": "https://vietnamfinance.vn/ngan-hang/", "category": "tai-chinh-ngan-hang"},
+    {"url": "https://vietnamfinance.vn/chung-khoan/", "category": "chung-khoan"},
+    {"url": "https://vietnamfinance.vn/bat-dong-san/", "category": "bat-dong-san"},
+    {"url": "https://vietnamfinance.vn/dau-tu/", "category": "vi-mo"},
+    {"url": "https://vietnamfinance.vn/ma/", "category": "vi-mo"},
+]
+
+CONTAINER = html_select.xpath("//div[@id='load_more_cate_pc']")
+ARTICLES = html_select.xpath(f".//div[{html_select.has_class('article')}]")
+TITLE_LINK = html_select.xpath(f".//h3[{html_select.has_class('article__title')}]")
+PUBLISH_TIME = html_select.xpath(f".//div[{html_select.has_class('detail-time-public')}]")
+
+
+class VietNamFinance(Source):
+    name = "vnfi"
+    display_name = "VietNamFinance"
+    specs = SPECS
+    headers = BROWSER_HEADERS
+    timeout = 15
+    parse_in_pool = True
+
+    def parse(self, content: bytes, spec: dict) -> list:
+        category = spec["category"]
+        tree = html_select.parse(content)
+        records = []
+
+        container = CONTAINER(tree)
+        if not container:
+            print(f"[WARN] No main container found at {spec['url']}")
+            return records
+
+        articles = ARTICLES(container[0])
+        print(f"[INFO] Found {len(articles)} articles")
+
+        for idx, article in enumerate(articles, start=1):
+            h3_tags = TITLE_LINK(article)
+            if not h3_tags:
+                print(f"[WARN] Skip article #{idx} (no title)")
+                continue
+
+            a_tag = next(h3_tags[0].iter("a"), None)
+            if a_tag is None:
+                print(f"[WARN] Skip article #{idx} (no link)")
+                continue
+
+            datetime_divs = PUBLISH_TIME(article)
+
+            records.append({
+                "title": html_select.text_of(a_tag),
+                "href": a_tag.get("href", "").strip(),
+                "category": category,
+                "publish_date": html_select.text_of(datetime_divs[0]) if datetime_divs else None
+            })
+
+        return records
+
+    def parse_date(self, raw: str):
+        """
+        Input : 12/01/26 13:43 (GMT+7)
+        Output:
+            - formatted: yyyy/mm/dd hh:mm:ss
+            - unix ts (UTC+7)
+        """
+        # tách phần datetime, bỏ (GMT+7)
+        return dates.VNFI.parse(raw.split("(")[0])
@@ -0,0 +1,88 @@
+from .. import dates
+from ..base import BROWSER_HEADERS, RssSource
+
+SPECS = [
+    # --- Tài chính - Ngân hàng ---
+    {
+        "url": "https://vietstock.vn/757/tai-chinh/ngan-hang.rss",
+        "category": "tai-chinh-ngan-hang"
+    },
+    {
+        "url": "https://vietstock.vn/758/tai-chinh/thue-va-ngan-sach.rss",
+        "category": "tai-chinh-ngan-hang"
+    },
+    {
+        "url": "https://vietstock.vn/3113/tai-chinh/bao-hiem.rss",
+        "category": "tai-chinh-ngan-hang"
+    },
+
+    # --- Bất động sản ---
+    {
+        "url": "https://vietstock.vn/4220/bat-dong-san/thi-truong-nha-dat.rss",
+        "category": "bat-dong-san"
+    },
+    {
+        "url": "https://vietstock.vn/42221/bat-dong-san/quy-hoach-ha-tang.rss",
+        "category": "bat-dong-san"
+    },
+
+    # --- Vĩ mô ---
+    {
+        "url": "https://vietstock.vn/761/kinh-te/vi-mo.rss",
+        "category": "vi-mo"
+    },
+    {
+        "url": "https://vietstock.vn/768/kinh-te/kinh-te-dau-tu.rss",
+        "category": "vi-mo"
+    },
+
+    # --- Chứng khoán ---
+    {
+        "url": "https://vietstock.vn/830/chung-khoan/co-phieu.rss",
+        "category": "chung-khoan"
+    },
+    {
+        "url": "https://vietstock.vn/143/chung-khoan/chinh-sach.rss",
+        "category": "chung-khoan"
+    },
+    {
+        "url": "https://vietstock.vn/738/doanh-nghiep/co-tuc.rss",
+        "category": "chung-khoan"
+    },
+    {
+        "url": "http://vietstock.vn/737/doanh-nghiep/hoat-dong-kinh-doanh.rss",
+        "category": "chung-khoan"
+    },
+    {
+        "url": "https://vietstock.vn/764/doanh-nghiep/tang-von-m-a.rss",
+        "category": "chung-khoan"
+    },
+    {
+        "url": "https://vietstock.vn/746/doanh-nghiep/ipo-co-phan-hoa.rss",
+        "category": "chung-khoan"
+    }
+]
+
+
+# 🔑 Header để tránh 403 (bắt buộc với Vietstock)
+HEADERS = dict(
+    BROWSER_HEADERS,
+    Accept="application/rss+xml,application/xml;q=0.9,*/*;q=0.8",
+)
+
+
+class VietStock(RssSource):
+    name = "vst"
+    display_name = "VietStock"
+    specs = SPECS
+    headers = HEADERS
+    timeout = 15
+
+    def parse_date(self, raw: str):
+        """
+        Input : Mon, 12 Jan 2026 13:19:00 +0700
+        Output:
+            - formatted: yyyy/mm/dd hh:mm:ss
+            - unix ts
+        """
+        return dates.RFC822.parse(raw)
@@ -0,0 +1,369 @@
+import binascii
+import glob
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from itertools import chain
+
+from . import http_cache, metrics, text, watermark
+from .base import ExtractContext, Source
+from .compaction import ensure_dedup_index
+from .fetcher import Fetcher
+from .http_cache import CACHE_DIR, HttpCache
+from .ndjson_io import NdjsonWriter, iter_ndjson
+
+TMP_DIR = ".tmp"
+DATA_DIR = "./data"
+BATCH_SIZE = 500  # số record / lần tra DB, / lần executemany (giới hạn RAM theo batch)
+QUARANTINE_DIR = os.path.join(DATA_DIR, "quarantine")
+QUARANTINE_DAYS = 30  # bản ghi quarantine cũ hơn bị xoá khỏi file
+
+_quarantine_lock = threading.Lock()
+
+INSERT_ARTICLE_SQL = """
+    INSERT INTO articles (
+        title,
+        href,
+        category,
+        publish_date,
+        title_latin,
+        href_hash,
+        publish_ts
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT DO NOTHING
+"""
+
+
+# ---------- extract ----------
+
+def extract(source: Source, fetcher: Fetcher, emit, backfill: bool = False, parse_pool=None) -> tuple:
+    """
+    Chạy plugin extract, mỗi page/feed parse xong được đẩy qua emit(key, records).
+    Trả về (watermark mới của nguồn phân trang, entry cache HTTP mới), cả 2 chưa commit.
+    """
+    with metrics.stage(source.name, "extract") as m:
+        watermarks = {}
+        if source.paginated and not backfill:
+            watermarks = watermark.load_watermarks(source.db_path)
+
+        cache = HttpCache(os.path.join(CACHE_DIR, source.name)) if source.use_cache else None
+
+        def counted_emit(key, records):
+            m.add("records_out", len(records))
+            emit(key, records)
+
+        ctx = ExtractContext(
+            metrics.CountingFetcher(fetcher, m), counted_emit,
+            watermarks=watermarks, backfill=backfill, cache=cache, parse_pool=parse_pool
+        )
+        source.extract(ctx)
+
+        if cache is None:
+            return ctx.new_watermarks, {}
+        cache.report(source.name)
+        return ctx.new_watermarks, cache.pending
+
+
+# ---------- transform ----------
+
+def transform(source: Source, raw_records, seen: set = None, stage_metrics: metrics.StageMetrics = None):
+    """
+    Generator: raw record -> record chuẩn (title_latin, href chuẩn hoá, href_hash, publish_ts).
+    Bỏ bản ghi thiếu field và trùng href_hash trong cùng lần chạy.
+    Chuẩn hoá title / URL + hash theo batch (source.latinize_many, normalize_urls, text.md5_many).
+    stage_metrics: đếm records_in / records_out / duplicates / quarantined nếu có
+    """
+    seen = set() if seen is None else seen
+    m = stage_metrics or metrics.StageMetrics(source.name, "transform")
+    quarantined = None  # href_hash đã có trong file quarantine, đọc khi gặp bản ghi lỗi đầu tiên
+
+    for batch in batched(raw_records):
+        m.add("records_in", len(batch))
+
+        valid = []
+        for r in batch:
+            title = (r.get("title") or "").strip()
+            href = (r.get("href") or "").strip()
+            pub_date_raw = (r.get("publish_date") or "").strip()
+
+            if not (title and href):
+                continue
+            if source.require_date and not pub_date_raw:
+                continue
+            valid.append((r, title, href, pub_date_raw))
+
+        hrefs = source.normalize_urls([v[2] for v in valid])
+        hashes = text.md5_many(hrefs)
+        latins = source.latinize_many([v[1] for v in valid])
+
+        out = 0
+        for (r, title, _, pub_date_raw), href_norm, href_hash, title_latin in zip(valid, hrefs, hashes, latins):
+            if href_hash in seen:
+                m.add("duplicates")
+                continue
+            seen.add(href_hash)
+
+            # publish_date + ts: ngày lỗi -> quarantine bản ghi đó, không dừng cả transform
+            try:
+                pub_date_fmt, pub_ts = source.parse_date(pub_date_raw)
+            except ValueError as e:
+                m.add("quarantined")
+                # bản ghi lỗi không vào DB nên feed trả lại mỗi lần chạy: chỉ ghi 1 lần
+                if quarantined is None:
+                    quarantined = load_quarantined(source)
+                if href_hash not in quarantined:
+                    quarantined.add(href_hash)
+                    quarantine(source, r, href_hash, e)
+                continue
+
+            out += 1
+            yield {
+                "title": title,
+                "title_latin": title_latin,
+                "href": href_norm,
+                "href_hash": href_hash,
+                "publish_date": pub_date_fmt,
+                "publish_ts": pub_ts,
+                "category": r.get("category"),
+            }
+        m.add("records_out", out)
+
+
+def quarantine_file(source: Source) -> str:
+    return os.path.join(QUARANTINE_DIR, f"{source.name}.ndjson")
+
+
+def load_quarantined(source: Source) -> set:
+    """
+    href_hash đã có trong file quarantine. Bản ghi quá QUARANTINE_DAYS bị bỏ (ghi .part rồi thay file),
+    nên file chỉ giữ các bản ghi lỗi khác nhau của QUARANTINE_DAYS ngày gần nhất.
+    """
+    path = quarantine_file(source)
+    if not os.path.exists(path):
+        return set()
+
+    cutoff = (datetime.now() - timedelta(days=QUARANTINE_DAYS)).isoformat(timespec="seconds")
+    with _quarantine_lock:
+        records = list(iter_ndjson(path))
+        kept = [r for r in records if r.get("quarantined_at", "") >= cutoff]
+        if len(kept) < len(records):
+            with NdjsonWriter(path + ".part") as writer:
+                writer.write_many(kept)
+            os.replace(path + ".part", path)
+    return {r.get("href_hash") for r in kept}
+
+
+def quarantine(source: Source, record: dict, href_hash: str, error: Exception):
+    """
+    Bản ghi không parse được -> data/quarantine/<source>.ndjson (kèm lỗi) để xem lại / sửa parser
+    """
+    print(f"[WARN] {source.name}: quarantined {record.get('href')}: {error}")
+    with _quarantine_lock:
+        os.makedirs(QUARANTINE_DIR, exist_ok=True)
+        with NdjsonWriter(quarantine_file(source), mode="a") as writer:
+            writer.write_many([{
+                **record,
+                "href_hash": href_hash,
+                "error": str(error),
+                "quarantined_at": datetime.now().isoformat(timespec="seconds"),
+            }])
+
+
+def batched(iterable, size: int = BATCH_SIZE):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def known_hashes(conn: sqlite3.Connection, hashes: list) -> set:
+    """
+    href_hash (hex) nào đã có trong articles của DB nguồn, tra qua unique index dedup
+    """
+    if not hashes:
+        return set()
+    rows = conn.execute(
+        f"SELECT href_hash FROM articles WHERE href_hash IN ({', '.join('?' * len(hashes))})",
+        [binascii.unhexlify(h) for h in hashes]
+    )
+    return {binascii.hexlify(r[0]).decode() for r in rows}
+
+
+# ---------- load ----------
+
+def load(source: Source, records, new_watermarks: dict = None, cache_entries: dict = None) -> int:
+    """
+    Nạp record vào db/<source>.db trong 1 transaction, kèm categories + watermark.
+    Bản ghi đã có (trùng unique index dedup) bị bỏ qua.
+    Transaction commit xong mới ghi entry cache HTTP của lần extract (cache_entries).
+    """
+    with metrics.stage(source.name, "load") as m:
+        inserted = _load(source, records, new_watermarks, m)
+    if cache_entries:
+        HttpCache(os.path.join(CACHE_DIR, source.name)).commit(cache_entries)
+    return inserted
+
+
+def _load(source: Source, records, new_watermarks: dict, m: metrics.StageMetrics) -> int:
+    # DB cũ chưa có unique index -> compaction 1 lần
+    ensure_dedup_index(source)
+
+    valid = 0
+    inserted = 0
+    categories = set()
+
+    conn = sqlite3.connect(source.db_path)
+    try:
+        with conn:
+            source.ensure_schema(conn)
+            # records có thể là generator (đọc file NDJSON): nạp theo batch, chung 1 transaction
+            for batch in batched(records):
+                rows = []
+                for r in batch:
+                    m.add("records_in")
+                    if not (r.get("title") and r.get("title_latin") and r.get("href") and r.get("href_hash")):
+                        continue
+
+                    rows.append((
+                        r["title"],
+                        r["href"],
+                        r.get("category"),
+                        r.get("publish_date"),
+                        r["title_latin"],
+                        binascii.unhexlify(r["href_hash"]),
+                        r.get("publish_ts")
+                    ))
+                    if r.get("category"):
+                        categories.add(r["category"])
+
+                valid += len(rows)
+                inserted += conn.executemany(INSERT_ARTICLE_SQL, rows).rowcount
+            source.insert_categories(conn, sorted(categories))
+            if new_watermarks:
+                watermark.commit_watermarks(conn, new_watermarks)
+    finally:
+        conn.close()
+
+    m.set("records_out", valid)
+    m.set("inserted", inserted)
+    m.set("duplicates", valid - inserted)
+    print(
+        f"[LOAD] {source.name}: inserted {inserted} new articles, "
+        f"skipped {valid - inserted} duplicates -> {source.db_path}"
+    )
+    return inserted
+
+
+# ---------- in-process: extract -> transform -> load, record giữ trong RAM ----------
+
+def run_source(source: Source, fetcher: Fetcher, backfill: bool = False, parse_pool=None) -> int:
+    raw_records = []
+    new_watermarks, cache_entries = extract(
+        source, fetcher, lambda key, records: raw_records.extend(records), backfill, parse_pool
+    )
+    with metrics.stage(source.name, "transform") as m:
+        records = list(transform(source, raw_records, stage_metrics=m))
+    return load(source, records, new_watermarks, cache_entries)
+
+
+# ---------- file mode: từng bước là 1 process riêng (DAG BashOperator) ----------
+
+def tmp_files(source: Source) -> list:
+    return sorted(glob.glob(os.path.join(TMP_DIR, f"{source.name}_*.ndjson")))
+
+
+def data_file(source: Source) -> str:
+    return os.path.join(DATA_DIR, f"{source.name}_news.ndjson")
+
+
+def extract_to_tmp(source: Source, backfill: bool = False):
+    """
+    Extract -> .tmp/<source>_<key>.ndjson (append + flush theo từng page)
+    """
+    os.makedirs(TMP_DIR, exist_ok=True)
+    for path in tmp_files(source):
+        os.remove(path)
+    watermark.clear_pending(source.name)
+    http_cache.clear_pending(source.name)
+
+    writers = {}
+
+    def emit(key, records):
+        if not records:
+            return
+        if key not in writers:
+            writers[key] = NdjsonWriter(os.path.join(TMP_DIR, f"{source.name}_{key}.ndjson"))
+        writers[key].write_many(records)
+
+    with Fetcher() as fetcher:
+        try:
+            new_watermarks, cache_entries = extract(source, fetcher, emit, backfill)
+        finally:
+            for writer in writers.values():
+                writer.close()
+
+    for writer in writers.values():
+        print(f"Saved {writer.count} records -> {writer.path}")
+
+    # watermark + cache HTTP chỉ được commit ở bước load
+    watermark.save_pending(source.name, new_watermarks)
+    http_cache.save_pending(source.name, cache_entries)
+
+
+def transform_tmp(source: Source):
+    """
+    .tmp/<source>_*.ndjson -> data/<source>_news.ndjson, đọc / ghi từng record (streaming)
+    - chỉ chứa bài mới của lần chạy: bài đã có trong db/<source>.db bị bỏ (tra unique index theo batch)
+    """
+    with metrics.stage(source.name, "transform") as m:
+        _transform_tmp(source, m)
+
+
+def _transform_tmp(source: Source, m: metrics.StageMetrics):
+    files = tmp_files(source)
+    out_file = data_file(source)
+    part_file = out_file + ".part"
+    os.makedirs(DATA_DIR, exist_ok=True)
+
+    conn = None
+    if os.path.exists(source.db_path):
+        ensure_dedup_index(source)
+        conn = sqlite3.connect(source.db_path)
+
+    raw_records = chain.from_iterable(iter_ndjson(path) for path in files)
+    try:
+        # không có file mới (vd. feed không đổi) -> output rỗng, load không nạp lại dữ liệu cũ
+        with NdjsonWriter(part_file) as writer:
+            for batch in batched(transform(source, raw_records, stage_metrics=m)):
+                known = known_hashes(conn, [r["href_hash"] for r in batch]) if conn else set()
+                m.add("duplicates", len(known))
+                writer.write_many(r for r in batch if r["href_hash"] not in known)
+    finally:
+        if conn is not None:
+            conn.close()
+
+    m.set("records_out", writer.count)
+    os.replace(part_file, out_file)
+    print(f"Saved {writer.count} new records -> {out_file}")
+
+    # cleanup tmp files
+    for path in files:
+        os.remove(path)
+
+
+def load_data_file(source: Source):
+    """
+    data/<source>_news.ndjson -> db/<source>.db (đọc từng dòng), commit watermark + cache HTTP đang chờ
+    """
+    path = data_file(source)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Missing data file: {path}")
+
+    load(source, iter_ndjson(path), watermark.read_pending(source.name), http_cache.read_pending(source.name))
+    watermark.clear_pending(source.name)
+    http_cache.clear_pending(source.name)
@@ -0,0 +1,167 @@
+"""
+Gom tin trùng giữa các nguồn thành story (cùng 1 sự kiện, tiêu đề hơi khác nhau)
+
+- shingle: cặp từ liên tiếp của tiêu đề đã bỏ dấu (đ -> d, giống nhau cho mọi nguồn)
+- MinHash NUM_PERM hàm băm, chia BANDS band; mỗi band -> 1 bucket (int 64 bit) lưu trong bảng story_buckets
+- tin mới chỉ so với các tin chung ít nhất 1 bucket, đăng cách nhau <= STORY_WINDOW
+  (tra index (bucket, publish_ts), không quét toàn bộ articles); mỗi bucket lấy tối đa
+  BUCKET_CANDIDATES tin mới nhất trong cửa sổ -> tiêu đề lặp theo mẫu ("Giá vàng hôm nay ...")
+  không làm chi phí mỗi tin tăng theo số tin
+- ứng viên được kiểm lại bằng Jaccard thật trên shingle, >= STORY_THRESHOLD thì vào story của ứng viên
+- chỉ gộp tin khác nguồn (cùng 1 nguồn: bài nối tiếp "lần 1 / lần 2" là các tin khác nhau)
+- story_id = rowid của tin đầu tiên trong story; tin không khớp / không có ngày: story_id = rowid của chính nó
+"""
+import hashlib
+import random
+import re
+import struct
+import zlib
+from functools import lru_cache
+
+from . import text
+
+STORY_COLUMN = "story_id"
+BUCKET_TABLE = "story_buckets"
+STORY_WINDOW = 2 * 86400   # giây, tin cùng story đăng cách nhau tối đa 2 ngày
+STORY_THRESHOLD = 0.5      # Jaccard shingle tối thiểu (0.4 đã gộp nhầm "Top 10 cổ phiếu tăng giá..." với "... 'bay cao'...")
+NUM_PERM = 32
+BANDS = 16                 # 16 band x 2 hàng: Jaccard 0.5 -> ~99% thành ứng viên
+ROWS = NUM_PERM // BANDS
+BUCKET_CANDIDATES = 20
+BATCH_SIZE = 500
+
+_MERSENNE = (1 << 61) - 1
+# seed cố định: bucket đã lưu phải tính ra giống nhau ở mọi lần chạy
+_rng = random.Random(20260118)
+PERMUTATIONS = [(_rng.randrange(1, _MERSENNE), _rng.randrange(_MERSENNE)) for _ in range(NUM_PERM)]
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+@lru_cache(maxsize=8192)
+def shingles(title: str) -> frozenset:
+    """
+    "Ngân hàng tăng vốn" -> {"ngan hang", "hang tang", "tang von"}; tiêu đề 1 từ -> {từ đó}
+    """
+    words = WORD_RE.findall(text.strip_accents(title or "").lower())
+    if len(words) < 2:
+        return frozenset(words)
+    return frozenset(f"{a} {b}" for a, b in zip(words, words[1:]))
+
+
+def signature(items: frozenset) -> list:
+    # crc32 thay cho hash(): hash của str đổi theo từng process
+    hashes = [zlib.crc32(s.encode("utf-8")) for s in items]
+    return [min((a * h + b) % _MERSENNE for h in hashes) for a, b in PERMUTATIONS]
+
+
+def buckets(items: frozenset) -> list:
+    """
+    Shingle -> BANDS bucket key (INTEGER có dấu 64 bit của SQLite), rỗng nếu không có shingle
+    """
+    if not items:
+        return []
+    sig = signature(items)
+    keys = []
+    for band in range(BANDS):
+        packed = struct.pack(f">B{ROWS}Q", band, *sig[band * ROWS:(band + 1) * ROWS])
+        keys.append(int.from_bytes(hashlib.blake2b(packed, digest_size=8).digest(), "big", signed=True))
+    return keys
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def ensure_schema(conn) -> bool:
+    """
+    Thêm cột story_id + bảng bucket nếu chưa có. True nếu vừa thêm (cần gom story cho toàn bộ tin cũ)
+    """
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(articles)")}
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {BUCKET_TABLE} (
+            bucket INTEGER NOT NULL,
+            publish_ts INTEGER NOT NULL,
+            rid INTEGER NOT NULL,
+            PRIMARY KEY (bucket, publish_ts, rid)
+        ) WITHOUT ROWID
+    """)
+    if STORY_COLUMN in columns:
+        return False
+
+    conn.execute(f"ALTER TABLE articles ADD COLUMN {STORY_COLUMN} INTEGER")
+    conn.execute(f"DELETE FROM {BUCKET_TABLE}")
+    # GUI: đếm số bản trùng của 1 story
+    conn.execute(f"""
+        CREATE INDEX IF NOT EXISTS idx_articles_story
+        ON articles ({STORY_COLUMN})
+    """)
+    return True
+
+
+def find_story(conn, rid: int, source: str, publish_ts: int, items: frozenset, keys: list):
+    """
+    story_id của tin giống nhất trong các bucket chung (trong cửa sổ thời gian), None nếu không có
+    """
+    per_bucket = f"""
+        SELECT rid FROM (
+            SELECT rid FROM {BUCKET_TABLE}
+            WHERE bucket = ? AND publish_ts BETWEEN ? AND ?
+            ORDER BY publish_ts DESC LIMIT {BUCKET_CANDIDATES}
+        )"""
+    params = []
+    for key in keys:
+        params += [key, publish_ts - STORY_WINDOW, publish_ts + STORY_WINDOW]
+    candidates = conn.execute(f"""
+        SELECT a.rowid, a.title, a.{STORY_COLUMN}
+        FROM articles a
+        WHERE a.rowid IN ({" UNION ".join([per_bucket] * len(keys))})
+          AND a.rowid != ? AND a.source IS NOT ?
+    """, [*params, rid, source]).fetchall()
+
+    best_story, best_score = None, STORY_THRESHOLD
+    for cand_rid, cand_title, cand_story in candidates:
+        score = jaccard(items, shingles(cand_title))
+        if score >= best_score:
+            best_story, best_score = cand_story or cand_rid, score
+    return best_story
+
+
+def assign(conn, after_rowid: int = 0) -> tuple:
+    """
+    Gán story_id cho các tin rowid > after_rowid chưa có story, theo thứ tự rowid
+    (tin gộp trước làm đại diện). Trả về (số tin xử lý, số tin vào story đã có).
+    Gọi trong transaction của merge.
+    """
+    processed = joined = 0
+    while True:
+        rows = conn.execute(f"""
+            SELECT rowid, title, source, publish_ts FROM articles
+            WHERE rowid > ? AND {STORY_COLUMN} IS NULL
+            ORDER BY rowid LIMIT ?
+        """, (after_rowid, BATCH_SIZE)).fetchall()
+        if not rows:
+            break
+
+        for rid, title, source, publish_ts in rows:
+            story_id = rid
+            if publish_ts is not None:
+                items = shingles(title)
+                keys = buckets(items)
+                if keys:
+                    found = find_story(conn, rid, source, publish_ts, items, keys)
+                    if found is not None:
+                        story_id = found
+                        joined += 1
+                    conn.executemany(
+                        f"INSERT OR IGNORE INTO {BUCKET_TABLE} (bucket, publish_ts, rid) VALUES (?, ?, ?)",
+                        [(key, publish_ts, rid) for key in keys]
+                    )
+            # ghi ngay (không đợi hết batch): tin sau trong cùng batch so được với tin này
+            conn.execute(f"UPDATE articles SET {STORY_COLUMN} = ? WHERE rowid = ?", (story_id, rid))
+        processed += len(rows)
+        after_rowid = rows[-1][0]
+
+    return processed, joined
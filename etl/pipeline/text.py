@@ -0,0 +1,133 @@
+import hashlib
+import unicodedata
+from urllib.parse import urlparse, urlunparse
+
+
+class _CharTable(dict):
+    """
+    Bảng str.translate tự điền: ký tự chưa gặp -> tính 1 lần bằng hàm per-char rồi nhớ lại.
+    Chuỗi dài chỉ còn 1 lần translate (C), không còn vòng lặp Python trên từng ký tự.
+    """
+
+    def __init__(self, func, preset: dict = None):
+        super().__init__()
+        self._func = func
+        for ch, value in (preset or {}).items():
+            self[ord(ch)] = value
+
+    def __missing__(self, code: int):
+        value = self._func(chr(code))
+        # giữ nguyên ký tự -> None của translate nghĩa là xoá, nên trả về code
+        self[code] = code if value == chr(code) else value
+        return self[code]
+
+
+def _strip_accents_char(ch: str) -> str:
+    return "".join(c for c in unicodedata.normalize("NFD", ch) if unicodedata.category(c) != "Mn")
+
+
+# NFD không tách được đ/Đ (chữ riêng, không phải d + dấu) -> map tay
+ACCENT_TABLE = _CharTable(_strip_accents_char, {"đ": "d", "Đ": "D"})
+
+
+def strip_accents(text: str) -> str:
+    """
+    Ép unicode tiếng Việt -> latin không dấu (kể cả đ/Đ -> d/D)
+    """
+    return text.translate(ACCENT_TABLE)
+
+
+def latinize_many(titles) -> list:
+    """
+    Batch: title -> title_latin (bỏ dấu, lowercase, strip)
+    """
+    table = ACCENT_TABLE
+    return [t.translate(table).lower().strip() for t in titles]
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonicalize + normalize URL để hash ổn định
+    - lowercase scheme + host
+    - bỏ fragment
+    - strip slash cuối
+    URL thường (scheme://host/path?query) cắt chuỗi trực tiếp, trường hợp lạ mới qua urlparse
+    """
+    url = url.strip()
+    scheme, sep, rest = url.partition("://")
+    if sep and scheme.isalpha() and not any(c in rest for c in ";\t\r\n[@\\"):
+        rest = rest.partition("#")[0]
+        rest, q, query = rest.partition("?")
+        netloc, slash, path = rest.partition("/")
+        path = (slash + path).rstrip("/")
+        return f"{scheme.lower()}://{netloc.lower()}{path}" + (f"?{query}" if query else "")
+
+    parsed = urlparse(url)
+
+    scheme = parsed.scheme.lower()
+    netloc = parsed.netloc.lower()
+    path = parsed.path.rstrip("/")
+
+    normalized = urlunparse((
+        scheme,
+        netloc,
+        path,
+        "",     # params
+        parsed.query,
+        ""      # fragment
+    ))
+    return normalized
+
+
+def normalize_urls(urls) -> list:
+    return [normalize_url(u) for u in urls]
+
+
+def md5_hash(text: str) -> str:
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+def md5_many(texts) -> list:
+    md5 = hashlib.md5
+    return [md5(t.encode("utf-8")).hexdigest() for t in texts]
+
+
+# ---------- biến thể riêng của nqs (giữ nguyên để href_hash / title_latin cũ không đổi) ----------
+
+def normalize_title_latin(text: str) -> str:
+    """
+    Bỏ dấu, chuyển latin, lowercase, strip
+    """
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKD", text)
+    return text.encode("ascii", "ignore").decode("ascii").lower().strip()
+
+
+def normalize_title_latin_many(titles) -> list:
+    # NFKD + encode ascii đã chạy trong C, nhanh hơn translate theo bảng -> chỉ gom batch
+    normalize = unicodedata.normalize
+    return [
+        normalize("NFKD", t).encode("ascii", "ignore").decode("ascii").lower().strip() if t else ""
+        for t in titles
+    ]
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Chuẩn hoá URL:
+    - lowercase scheme + host
+    - remove fragment
+    - strip trailing slash
+    """
+    if not url:
+        return ""
+
+    parsed = urlparse(url.strip())
+    normalized = parsed._replace(
+        scheme=parsed.scheme.lower(),
+        netloc=parsed.netloc.lower(),
+        fragment=""
+    )
+    canon = urlunparse(normalized)
+    return canon.rstrip("/")
@@ -0,0 +1,93 @@
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+STATE_TABLE = "crawl_state"
+PENDING_DIR = ".tmp"
+
+
+def is_backfill() -> bool:
+    """
+    Chế độ backfill: bỏ qua watermark, crawl sâu lịch sử
+    - bật bằng tham số --backfill hoặc biến môi trường ETL_BACKFILL=1
+    """
+    return "--backfill" in sys.argv or os.environ.get("ETL_BACKFILL") == "1"
+
+
+def ensure_state_table(conn: sqlite3.Connection):
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {STATE_TABLE} (
+            channel TEXT PRIMARY KEY,
+            watermark INTEGER NOT NULL,
+            updated_at TEXT
+        )
+    """)
+
+
+def load_watermarks(db_path: str) -> dict:
+    """
+    Đọc watermark đã lưu: channel -> giá trị lớn nhất đã nạp vào DB
+    """
+    if not os.path.exists(db_path):
+        return {}
+
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(f"SELECT channel, watermark FROM {STATE_TABLE}").fetchall()
+    except sqlite3.OperationalError:
+        rows = []
+    finally:
+        conn.close()
+
+    return {channel: value for channel, value in rows}
+
+
+def _pending_path(source: str) -> str:
+    return os.path.join(PENDING_DIR, f"watermarks_{source}.json")
+
+
+def save_pending(source: str, marks: dict):
+    """
+    Extract ghi watermark mới ra .tmp, chỉ được commit sau khi load thành công
+    """
+    if not marks:
+        return
+
+    os.makedirs(PENDING_DIR, exist_ok=True)
+    with open(_pending_path(source), "w", encoding="utf-8") as f:
+        json.dump({str(k): v for k, v in marks.items()}, f)
+
+
+def commit_watermarks(conn: sqlite3.Connection, marks: dict):
+    """
+    Upsert watermark, chỉ tăng không giảm
+    """
+    ensure_state_table(conn)
+    now = datetime.utcnow().isoformat()
+    conn.executemany(f"""
+        INSERT INTO {STATE_TABLE} (channel, watermark, updated_at)
+        VALUES (?, ?, ?)
+        ON CONFLICT(channel) DO UPDATE SET
+            watermark = MAX(watermark, excluded.watermark),
+            updated_at = excluded.updated_at
+    """, [(str(k), int(v), now) for k, v in marks.items()])
+
+
+def read_pending(source: str) -> dict:
+    """
+    Watermark extract ghi ra .tmp, load commit cùng transaction với articles
+    """
+    path = _pending_path(source)
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def clear_pending(source: str):
+    path = _pending_path(source)
+    if os.path.exists(path):
+        os.remove(path)
@@ -3,6 +3,6 @@ set -euo pipefail
 ROOT_DIR="$(cd "$(dirname "$0")" && pwd)"
 cd "$ROOT_DIR"
 source .venv/bin/activate
-python3 tbkt_extract.py
+python3 tbkt_extract.py "$@"
 deactivate
  
\ No newline at end of file
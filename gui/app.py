@@ -1,36 +1,95 @@
 import streamlit as st
+import shutil
 import sqlite3
+import subprocess
+import threading
 import pandas as pd
-from datetime import datetime, timedelta
-import unidecode
+
+from queries import (
+    BUSY_TIMEOUT, SORT_OPTIONS, STATUS_DB_ALIAS, TIME_FILTERS, build_article_query, connect_status_db,
+    data_version, day_range, has_fts, has_stories, load_categories, load_counts, move_status_table, save_statuses, time_range
+)
 
 # ================= CONFIG =================
 DB_FILE = "../db/total_news.db"
-STATUS_TABLE = "user_article_status"
-ARTICLES_TABLE = "articles"
+STATUS_DB_FILE = "../db/user_state.db"  # Read/Favorite, tách khỏi DB mà ETL merge ghi vào
 PAGE_SIZE = 100
+MMAP_SIZE = 256 * 1024 * 1024
+RESULT_TTL = 300          # giây
+RESULT_CACHE_SIZE = 256   # số trang kết quả giữ trong RAM
+GSETTINGS_TIMEOUT = 1     # giây
 
 st.set_page_config(page_title="Bank News", layout="wide")
 
 # ================= SESSION =================
-if "page" not in st.session_state:
-    st.session_state.page = 0
+def reset_list():
+    """
+    Danh sách tin đã tải giữ trong session, "Load more" chỉ tải thêm 1 trang sau cursor
+    """
+    st.session_state.rows = None        # DataFrame các tin đã tải
+    st.session_state.cursor = None      # (publish_ts, rowid) của dòng cuối
+    st.session_state.exhausted = False  # hết dữ liệu
+    st.session_state.target = PAGE_SIZE # số tin cần có
+    st.session_state.window = 0         # trang đang xem (windowed list)
+    # đổi key bảng fast list, bỏ các chỉnh sửa theo vị trí dòng của danh sách cũ
+    st.session_state.list_id = st.session_state.get("list_id", 0) + 1
+
+
+def load_more():
+    st.session_state.target += PAGE_SIZE
+
+
+def move_window(step):
+    st.session_state.window = max(0, st.session_state.window + step)
+    st.session_state.target = max(st.session_state.target, (st.session_state.window + 1) * PAGE_SIZE)
+
+
+if "rows" not in st.session_state:
+    reset_list()
+
+# Read/Favorite đã đổi, chờ ghi DB: {href_hash: (is_read, is_favorite)}
+if "pending_status" not in st.session_state:
+    st.session_state.pending_status = {}
+
+
+def mark_status(href_hash):
+    """
+    on_change của checkbox Read/Favorite: chỉ ghi nhận, flush 1 lần ở đầu lần rerun
+    """
+    st.session_state.pending_status[href_hash] = (
+        st.session_state[f"read_{href_hash}"],
+        st.session_state[f"fav_{href_hash}"],
+    )
+
+def mark_grid_status(key, visible):
+    """
+    on_change của bảng fast list: edited_rows {vị trí dòng: {cột: giá trị}} -> pending_status
+    """
+    for pos, changes in st.session_state[key]["edited_rows"].items():
+        row = visible.iloc[int(pos)]
+        st.session_state.pending_status[row["href_hash"]] = (
+            changes.get("is_read", row["is_read"]),
+            changes.get("is_favorite", row["is_favorite"]),
+        )
 
 # ================= THEME COLORS =================
-import subprocess
-
+@st.cache_data(show_spinner=False)
 def is_system_dark():
+    """
+    Theme GNOME, dò 1 lần cho cả process (server headless không có gsettings -> False)
+    """
+    if shutil.which("gsettings") is None:
+        return False
     try:
         result = subprocess.run(
             ["gsettings", "get", "org.gnome.desktop.interface", "gtk-theme"],
-            capture_output=True, text=True
+            capture_output=True, text=True, timeout=GSETTINGS_TIMEOUT
         )
         theme_name = result.stdout.strip().strip("'").lower()
         return "dark" in theme_name
     except Exception:
         return False
 
-is_dark = is_system_dark()
 theme = st.get_option("theme.base")
 is_dark = theme == "dark" or is_system_dark()
 
@@ -61,16 +120,74 @@ a:hover {{ text-decoration: underline; }}
 </style>
 """, unsafe_allow_html=True)
 
+# ================= DB =================
+@st.cache_resource
+def get_read_conn():
+    """
+    1 connection đọc dùng chung cho cả process (mọi session / rerun), khoá bằng lock
+    """
+    # Khởi tạo 1 lần: WAL cho cả 2 DB, chuyển bảng status cũ ra khỏi total_news.db
+    connect_status_db(STATUS_DB_FILE).close()
+    init_conn = sqlite3.connect(DB_FILE, timeout=BUSY_TIMEOUT)
+    init_conn.execute("PRAGMA journal_mode=WAL")
+    move_status_table(init_conn, STATUS_DB_FILE)
+    init_conn.close()
+
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False, timeout=BUSY_TIMEOUT)
+    conn.execute(f"ATTACH DATABASE ? AS {STATUS_DB_ALIAS}", (STATUS_DB_FILE,))
+    conn.execute("PRAGMA query_only=ON")
+    conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+    return conn, threading.Lock()
+
+
+def read_db(func, *args):
+    conn, lock = get_read_conn()
+    with lock:
+        return func(conn, *args)
+
+
+@st.cache_data(ttl=RESULT_TTL, show_spinner=False)
+def load_db_info(version):
+    """
+    Categories (tối đa 4) + DB đã có FTS / story_id chưa, chỉ đọc lại khi version đổi
+    """
+    return read_db(load_categories), read_db(has_fts), read_db(has_stories)
+
+
+@st.cache_data(ttl=RESULT_TTL, show_spinner=False)
+def load_stats(version, start_day, end_day):
+    """
+    Số tin theo (category, source) từ bảng tổng hợp daily_counts
+    """
+    rows = read_db(load_counts, start_day, end_day)
+    if rows is None:
+        return None
+    return pd.DataFrame(rows, columns=["category", "source", "count"])
+
+
+@st.cache_data(ttl=RESULT_TTL, max_entries=RESULT_CACHE_SIZE, show_spinner=False)
+def fetch_page(filters, limit, after, offset, version):
+    """
+    1 trang kết quả, cache theo (filters, cursor/offset, version dữ liệu)
+    """
+    categories, keyword, sort, time_filter, filter_read, filter_fav, use_fts, collapse = filters
+    start_ts, end_ts = time_range(time_filter)
+    query, params = build_article_query(
+        list(categories), keyword, start_ts, end_ts, filter_read, filter_fav, limit,
+        sort=sort, use_fts=use_fts, after=after, offset=offset, collapse=collapse
+    )
+    return read_db(lambda conn: pd.read_sql(query, conn, params=params))
+
+
+version = read_db(data_version)
+categories, use_fts, use_stories = load_db_info(version)
+
 # ================= SIDEBAR =================
 st.sidebar.header("Filters")
 
-conn = sqlite3.connect(DB_FILE)
-
-# Load categories: tối đa 4
-categories_from_db = conn.execute(
-    "SELECT DISTINCT category FROM categories ORDER BY category LIMIT 4"
-).fetchall()
-categories = [row[0] for row in categories_from_db]
+# Số tin theo khoảng thời gian đang chọn (selectbox Time range nằm bên dưới, đọc từ session)
+stats = load_stats(version, *day_range(st.session_state.get("time_filter", TIME_FILTERS[0])))
+category_counts = None if stats is None else stats.groupby("category")["count"].sum().to_dict()
 
 # ================= CATEGORY CHECKBOX =================
 if "selected_categories" not in st.session_state:
@@ -86,144 +203,173 @@ st.sidebar.button("All / None", on_click=toggle_categories)
 
 selected_categories = []
 for cat in categories:
-    if st.sidebar.checkbox(cat, value=(cat in st.session_state.selected_categories)):
+    label = cat if category_counts is None else f"{cat} ({category_counts.get(cat, 0)})"
+    if st.sidebar.checkbox(label, value=(cat in st.session_state.selected_categories)):
         selected_categories.append(cat)
 st.session_state.selected_categories = selected_categories
 
 # ================= KEYWORD =================
 keyword = st.sidebar.text_input("Search keyword")
 
+# ================= SORT =================
+sort_by = st.sidebar.radio("Sort by", options=SORT_OPTIONS, horizontal=True, disabled=not keyword)
+
 # ================= TIME FILTER =================
 time_filter = st.sidebar.selectbox(
     "Time range",
-    options=["All", "Today", "Yesterday", "This week", "This month"]
+    options=TIME_FILTERS,
+    key="time_filter"
 )
 
+# ================= STATS =================
+with st.sidebar.expander("Stats"):
+    if stats is None:
+        st.caption("Chưa có bảng thống kê (chạy _total_load)")
+    elif stats.empty:
+        st.caption(f"Không có tin ({time_filter})")
+    else:
+        st.metric(f"News ({time_filter})", int(stats["count"].sum()))
+        st.dataframe(
+            stats.pivot_table(index="source", columns="category", values="count",
+                              aggfunc="sum", fill_value=0, margins=True, margins_name="Total"),
+        )
+
 # ================= READ/FAVORITE FILTER =================
 filter_read = st.sidebar.checkbox("Show Read only", value=False)
 filter_fav = st.sidebar.checkbox("Show Favorite only", value=False)
 
-# ================= RESET PAGE ON FILTER CHANGE =================
-current_filter = (st.session_state.selected_categories, keyword, time_filter, filter_read, filter_fav)
+# ================= COLLAPSE DUPLICATES =================
+collapse = st.sidebar.checkbox(
+    "Collapse duplicates", value=False, disabled=not use_stories,
+    help="Cùng 1 tin trên nhiều nguồn chỉ hiện 1 dòng" if use_stories else "Chưa có story_id (chạy _total_load)"
+) and use_stories
+
+# ================= WINDOWED LIST =================
+windowed = st.sidebar.checkbox("Windowed list", value=False, help=f"Chỉ render {PAGE_SIZE} tin mỗi lần")
+
+# ================= FAST LIST =================
+fast_list = st.sidebar.checkbox("Fast list", value=False, help="Render danh sách thành 1 bảng, sửa Read/Favorite hàng loạt")
+
+# ================= RESET LIST ON FILTER CHANGE =================
+current_filter = (st.session_state.selected_categories, keyword, sort_by, time_filter, filter_read, filter_fav, collapse)
 if "last_filter" not in st.session_state:
     st.session_state.last_filter = current_filter
 if st.session_state.last_filter != current_filter:
-    st.session_state.page = 0
+    reset_list()
     st.session_state.last_filter = current_filter
 
-# ================= INIT STATUS TABLE =================
-conn.execute(f"""
-CREATE TABLE IF NOT EXISTS {STATUS_TABLE} (
-    href_hash TEXT PRIMARY KEY,
-    is_read INTEGER DEFAULT 0,
-    is_favorite INTEGER DEFAULT 0
-)
-""")
-conn.commit()
-
-# ================= BUILD QUERY =================
-limit = (st.session_state.page + 1) * PAGE_SIZE
-params = []
-query = f"""
-SELECT a.title, a.title_latin, a.href, a.href_hash, a.publish_date, a.publish_ts, a.category, a.source,
-       IFNULL(s.is_read,0) AS is_read, IFNULL(s.is_favorite,0) AS is_favorite
-FROM articles a
-LEFT JOIN {STATUS_TABLE} s ON a.href_hash = s.href_hash
-WHERE 1=1
-"""
-
-# Category filter
-if selected_categories:
-    placeholders = ",".join("?" for _ in selected_categories)
-    query += f" AND a.category IN ({placeholders})"
-    params.extend(selected_categories)
-
-# Keyword filter: latin không dấu + LIKE
-# if keyword:
-#     keyword_latin = unidecode.unidecode(keyword.lower())
-#     query += " AND lower(a.title_latin) LIKE ?"
-#     params.append(f"%{keyword_latin}%")
-
-if keyword:
-    # 1. Ép sang latin không dấu
-    keyword_latin = unidecode.unidecode(keyword.lower())
-    # 2. Tách thành các từ
-    words = [w.strip() for w in keyword_latin.split() if w.strip()]
-    # 3. Thêm điều kiện LIKE cho từng từ
-    for w in words:
-        query += " AND lower(a.title_latin) LIKE ?"
-        params.append(f"%{w}%")
-
-# Time filter
-now = datetime.now()
-if time_filter == "Today":
-    start_ts = int(datetime(now.year, now.month, now.day).timestamp())
-    end_ts = int(now.timestamp())
-elif time_filter == "Yesterday":
-    yesterday = now - timedelta(days=1)
-    start_ts = int(datetime(yesterday.year, yesterday.month, yesterday.day).timestamp())
-    end_ts = int(datetime(now.year, now.month, now.day).timestamp())
-elif time_filter == "This week":
-    start_of_week = now - timedelta(days=now.weekday())
-    start_ts = int(datetime(start_of_week.year, start_of_week.month, start_of_week.day).timestamp())
-    end_ts = int(now.timestamp())
-elif time_filter == "This month":
-    start_ts = int(datetime(now.year, now.month, 1).timestamp())
-    end_ts = int(now.timestamp())
-else:
-    start_ts = None
-    end_ts = None
+# Flush trạng thái đã đổi (connection ghi riêng), cập nhật luôn các dòng đã tải
+if st.session_state.pending_status:
+    write_conn = connect_status_db(STATUS_DB_FILE)
+    save_statuses(write_conn, st.session_state.pending_status)
+    write_conn.close()
+    # kết quả đã cache chứa is_read / is_favorite cũ
+    fetch_page.clear()
+    rows = st.session_state.rows
+    if rows is not None:
+        for h, (is_read, is_fav) in st.session_state.pending_status.items():
+            rows.loc[rows["href_hash"] == h, ["is_read", "is_favorite"]] = [int(is_read), int(is_fav)]
+    st.session_state.pending_status = {}
+    # Đang lọc theo Read/Favorite: tải lại để bỏ/thêm dòng vừa đổi
+    if filter_read or filter_fav:
+        reset_list()
+
+# ================= LOAD DATA =================
+filters = (tuple(selected_categories), keyword, sort_by, time_filter, filter_read, filter_fav, use_fts, collapse)
+by_relevance = bool(keyword) and sort_by == "Relevance"
 
-if start_ts is not None and end_ts is not None:
-    query += " AND a.publish_ts BETWEEN ? AND ?"
-    params.extend([start_ts, end_ts])
 
-# Read/fav
-if filter_read:
-    query += " AND IFNULL(s.is_read,0)=1"
-if filter_fav:
-    query += " AND IFNULL(s.is_favorite,0)=1"
+# Chỉ tải các trang còn thiếu, các trang trước đã nằm trong session
+while not st.session_state.exhausted and (
+    st.session_state.rows is None or len(st.session_state.rows) < st.session_state.target
+):
+    loaded = 0 if st.session_state.rows is None else len(st.session_state.rows)
+    cursor = st.session_state.cursor
 
-# Sort & limit
-query += " ORDER BY a.publish_ts DESC LIMIT ?"
-params.append(limit)
+    if by_relevance:
+        page = fetch_page(filters, PAGE_SIZE, None, loaded, version)
+    else:
+        page = fetch_page(filters, PAGE_SIZE, cursor, 0, version)
+        # Tin không có ngày (publish_ts NULL) nằm cuối danh sách, cursor có ngày không với tới
+        if len(page) < PAGE_SIZE and cursor is not None and cursor[0] is not None:
+            tail = fetch_page(filters, PAGE_SIZE - len(page), (None, 0), 0, version)
+            page = pd.concat([page, tail], ignore_index=True)
+
+    st.session_state.exhausted = len(page) < PAGE_SIZE
+    if len(page):
+        last = page.iloc[-1]
+        last_ts = None if pd.isna(last["publish_ts"]) else int(last["publish_ts"])
+        st.session_state.cursor = (last_ts, int(last["rid"]))
+
+    if st.session_state.rows is None:
+        st.session_state.rows = page
+    else:
+        st.session_state.rows = pd.concat([st.session_state.rows, page], ignore_index=True)
 
-# ================= LOAD DATA =================
-df = pd.read_sql(query, conn, params=params)
-conn.close()
+df = st.session_state.rows
 
 # ================= DASHBOARD =================
 st.title("📰 Bank News")
 st.caption(f"Showing {len(df)} news")
 
 # ================= NEWS LIST =================
-for idx, row in df.iterrows():
-    href_hash = row["href_hash"]
-    stt = idx + 1
-    col0, col1, col2, col3, col4, col5 = st.columns([0.5,7.0,1.5,1.5,0.8,0.8])
-
-    col0.markdown(f"<div class='stt'>{stt}</div>", unsafe_allow_html=True)
-    col1.markdown(f"<div class='title'><a href='{row['href']}' target='_blank'>{row['title']}</a></div>", unsafe_allow_html=True)
-    col2.markdown(f"<div class='channel'>{row['category']}</div>", unsafe_allow_html=True)
-    col3.markdown(f"<div class='time'>{row['publish_date']}</div>", unsafe_allow_html=True)
-
-    # Read/Favorite checkbox
-    is_read = col4.checkbox("Read", value=bool(row["is_read"]), key=f"read_{href_hash}")
-    is_fav = col5.checkbox("⭐", value=bool(row["is_favorite"]), key=f"fav_{href_hash}")
-
-    # Update status DB
-    conn = sqlite3.connect(DB_FILE)
-    conn.execute(f"""
-    INSERT INTO {STATUS_TABLE} (href_hash, is_read, is_favorite)
-    VALUES (?, ?, ?)
-    ON CONFLICT(href_hash) DO UPDATE SET
-        is_read=excluded.is_read,
-        is_favorite=excluded.is_favorite
-    """, (href_hash, int(is_read), int(is_fav)))
-    conn.commit()
-    conn.close()
+# Windowed: chỉ render 1 trang, chi phí mỗi lần rerun không tăng theo số tin đã tải
+if windowed:
+    window_start = st.session_state.window * PAGE_SIZE
+    visible = df.iloc[window_start:window_start + PAGE_SIZE]
+else:
+    visible = df
+
+if fast_list:
+    # 1 element cho cả danh sách thay vì 6 cột + 6 element mỗi dòng
+    columns = ["title", "href", "category", "publish_date", "is_read", "is_favorite"]
+    if collapse:
+        columns.insert(1, "story_size")
+    grid = visible[columns].copy()
+    grid["is_read"] = grid["is_read"].astype(bool)
+    grid["is_favorite"] = grid["is_favorite"].astype(bool)
+    grid.index = grid.index + 1
+    grid_key = f"grid_{st.session_state.list_id}_{st.session_state.window if windowed else 0}"
+    st.data_editor(
+        grid,
+        key=grid_key,
+        on_change=mark_grid_status,
+        args=(grid_key, visible),
+        disabled=[c for c in columns if c not in ("is_read", "is_favorite")],
+        column_config={
+            "title": st.column_config.TextColumn("Title", width="large"),
+            "story_size": st.column_config.NumberColumn("Sources", help="Số nguồn đăng cùng tin"),
+            "href": st.column_config.LinkColumn("Link", display_text="Open"),
+            "category": st.column_config.TextColumn("Category"),
+            "publish_date": st.column_config.TextColumn("Time"),
+            "is_read": st.column_config.CheckboxColumn("Read"),
+            "is_favorite": st.column_config.CheckboxColumn("⭐"),
+        },
+    )
+else:
+    for idx, row in visible.iterrows():
+        href_hash = row["href_hash"]
+        stt = idx + 1
+        col0, col1, col2, col3, col4, col5 = st.columns([0.5,7.0,1.5,1.5,0.8,0.8])
+
+        col0.markdown(f"<div class='stt'>{stt}</div>", unsafe_allow_html=True)
+        # Collapse: số nguồn khác đăng cùng tin
+        more = f" <span class='channel'>+{row['story_size'] - 1}</span>" if collapse and row["story_size"] > 1 else ""
+        col1.markdown(f"<div class='title'><a href='{row['href']}' target='_blank'>{row['title']}</a>{more}</div>", unsafe_allow_html=True)
+        col2.markdown(f"<div class='channel'>{row['category']}</div>", unsafe_allow_html=True)
+        col3.markdown(f"<div class='time'>{row['publish_date']}</div>", unsafe_allow_html=True)
+
+        # Read/Favorite checkbox: thay đổi đi qua on_change, không ghi DB trong vòng lặp
+        col4.checkbox("Read", value=bool(row["is_read"]), key=f"read_{href_hash}",
+                      on_change=mark_status, args=(href_hash,))
+        col5.checkbox("⭐", value=bool(row["is_favorite"]), key=f"fav_{href_hash}",
+                      on_change=mark_status, args=(href_hash,))
 
 # ================= LOAD MORE =================
-if len(df) >= limit:
-    if st.button("Load more"):
-        st.session_state.page += 1
+if windowed:
+    nav_prev, nav_next = st.columns(2)
+    nav_prev.button("Previous", on_click=move_window, args=(-1,), disabled=st.session_state.window == 0)
+    nav_next.button("Next", on_click=move_window, args=(1,),
+                    disabled=st.session_state.exhausted and window_start + PAGE_SIZE >= len(df))
+elif not st.session_state.exhausted:
+    st.button("Load more", on_click=load_more)
@@ -0,0 +1,116 @@
+"""
+Benchmark render danh sách tin: 6 cột mỗi dòng vs fast list (1 bảng data_editor)
+
+- Fixture: total_news.db 1.000 tin trong thư mục tạm (không đụng db/ thật)
+- Bấm "Load more" tới khi đủ 1.000 tin, rồi đo 1 lần rerun (giống mỗi lần click bất kỳ widget nào)
+- Payload: tổng kích thước ForwardMsg (protobuf) script gửi về browser trong lần rerun đó
+
+Chạy từ thư mục gui/:
+    python3 bench/bench_render.py [--rows 1000]
+"""
+import argparse
+import hashlib
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1 import local_script_runner
+
+GUI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_FILE = os.path.join(GUI_DIR, "app.py")
+sys.path.insert(0, GUI_DIR)
+
+CATEGORIES = ["chung-khoan", "tai-chinh-ngan-hang", "vi-mo", "bat-dong-san"]
+
+# --- đo payload: cộng kích thước mọi ForwardMsg của lần run gần nhất ---
+_payload = {"bytes": 0}
+_parse_tree = local_script_runner.parse_tree_from_messages
+
+
+def _measure_parse_tree(messages):
+    _payload["bytes"] = sum(msg.ByteSize() for msg in messages)
+    return _parse_tree(messages)
+
+
+local_script_runner.parse_tree_from_messages = _measure_parse_tree
+
+
+def build_fixture(db_path: str, rows: int):
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE articles (
+            id INTEGER, title TEXT, href TEXT, category TEXT, publish_date TEXT,
+            title_latin TEXT, href_hash BLOB, publish_ts INTEGER, source TEXT
+        )
+    """)
+    conn.execute("CREATE TABLE categories (category TEXT PRIMARY KEY)")
+    conn.executemany("INSERT INTO categories VALUES (?)", [(c,) for c in CATEGORIES])
+
+    base_ts = 1767200000
+    data = []
+    for i in range(rows):
+        href = f"https://example.vn/tin-tuc/bai-viet-so-{i}.html"
+        ts = base_ts - i * 600
+        data.append((
+            i + 1,
+            f"Tin thử nghiệm số {i}: lãi suất ngân hàng và thị trường chứng khoán",
+            href,
+            CATEGORIES[i % len(CATEGORIES)],
+            time.strftime("%Y/%m/%d %H:%M:%S", time.localtime(ts)),
+            f"tin thu nghiem so {i}: lai suat ngan hang va thi truong chung khoan",
+            hashlib.md5(href.encode()).digest(),
+            ts,
+            "VietStock",
+        ))
+    conn.executemany("INSERT INTO articles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", data)
+    conn.commit()
+    conn.close()
+
+
+def measure(rows: int, fast: bool):
+    at = AppTest.from_file(APP_FILE, default_timeout=300).run()
+    if fast:
+        next(c for c in at.sidebar.checkbox if c.label == "Fast list").check().run()
+
+    while len(at.session_state.rows) < rows:
+        load_more = [b for b in at.button if b.label == "Load more"]
+        if not load_more:
+            break
+        load_more[0].click().run()
+
+    t0 = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - t0
+
+    if at.exception:
+        raise RuntimeError(at.exception)
+    return len(at.session_state.rows), elapsed, _payload["bytes"]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, "db"))
+        os.makedirs(os.path.join(tmp, "gui"))
+        build_fixture(os.path.join(tmp, "db", "total_news.db"), args.rows)
+
+        # app đọc ../db/total_news.db theo cwd
+        cwd = os.getcwd()
+        os.chdir(os.path.join(tmp, "gui"))
+        try:
+            for fast in (False, True):
+                loaded, elapsed, payload = measure(args.rows, fast)
+                label = "fast list" if fast else "columns  "
+                print(f"[BENCH] {label}: {loaded} rows, rerun {elapsed * 1000:.0f} ms, payload {payload / 1024:.0f} KB")
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark thời gian chạy script app.py (streamlit.testing, không cần browser)
+
+- cold : lần chạy đầu của process (cache_resource / cache_data còn trống)
+- warm : session mới, cache đã có (mở tab mới)
+- rerun: cùng session, tick 1 checkbox Read (mỗi click là 1 lần rerun)
+- gsettings: chi phí 1 lần spawn gsettings như bản cũ (mỗi rerun gọi 2 lần)
+
+Chạy từ thư mục gui/ (app đọc ../db/total_news.db, nên chạy trên bản copy nếu không muốn ghi status):
+    python3 bench/bench_startup.py [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+APP_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+def timed(func):
+    t0 = time.perf_counter()
+    result = func()
+    return time.perf_counter() - t0, result
+
+
+def fmt(samples):
+    return f"median {statistics.median(samples) * 1000:.0f} ms (min {min(samples) * 1000:.0f}, max {max(samples) * 1000:.0f})"
+
+
+def gsettings_once():
+    try:
+        subprocess.run(
+            ["gsettings", "get", "org.gnome.desktop.interface", "gtk-theme"],
+            capture_output=True, text=True
+        )
+    except Exception:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    cold, at = timed(lambda: AppTest.from_file(APP_FILE, default_timeout=120).run())
+    if at.exception:
+        print(f"[ERROR] {at.exception}")
+        sys.exit(1)
+    print(f"[BENCH] cold     : {cold * 1000:.0f} ms")
+
+    warm = [timed(lambda: AppTest.from_file(APP_FILE, default_timeout=120).run())[0] for _ in range(args.runs)]
+    print(f"[BENCH] warm     : {fmt(warm)}")
+
+    at = AppTest.from_file(APP_FILE, default_timeout=120).run()
+    reruns = []
+    for i in range(args.runs):
+        boxes = [c for c in at.checkbox if c.key and c.key.startswith("read_")]
+        if not boxes:
+            break
+        box = boxes[i % len(boxes)]
+        action = box.uncheck if box.value else box.check
+        reruns.append(timed(lambda: action().run())[0])
+    if reruns:
+        print(f"[BENCH] rerun    : {fmt(reruns)}")
+
+    spawn = [timed(gsettings_once)[0] for _ in range(args.runs)]
+    print(f"[BENCH] gsettings: {fmt(spawn)} / spawn (bản cũ: 2 spawn mỗi rerun)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Kiểm tra EXPLAIN QUERY PLAN cho mọi tổ hợp bộ lọc của GUI: không được rơi về full table scan
+
+- Copy db/total_news.db ra file tạm, tạo index + FTS như _total_load
+- Với mỗi tổ hợp (category, keyword, sort, time range, read, favorite, keyset cursor, collapse): dựng query bằng queries.build_article_query
+- Lỗi (exit 1) nếu plan có "SCAN a" mà không dùng index, hoặc join bảng status không phải lookup theo khoá
+- Bảng status cũ trong total_news.db (href_hash TEXT) được migrate + chuyển sang user_state.db
+  như lúc app khởi động, kiểm tra không mất dòng join
+
+Chạy từ thư mục gui/:
+    python3 bench/check_query_plan.py [--db ../db/total_news.db]
+"""
+import argparse
+import itertools
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+GUI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ETL_DIR = os.path.join(os.path.dirname(GUI_DIR), "etl")
+sys.path.insert(0, GUI_DIR)
+sys.path.insert(0, ETL_DIR)
+
+import _total_load  # noqa: E402
+from queries import (  # noqa: E402
+    SORT_OPTIONS, STATUS_DB_ALIAS, STATUS_TABLE, build_article_query, connect_status_db, move_status_table,
+    time_range
+)
+
+CATEGORY_OPTIONS = [[], ["chung-khoan"], ["chung-khoan", "tai-chinh-ngan-hang"]]
+KEYWORD_OPTIONS = ["", "ngân hàng"]
+TIME_OPTIONS = ["All", "Today", "This month"]
+# trang đầu / trang sau (cursor có ngày) / phần tin không có ngày
+AFTER_OPTIONS = [None, (1768000000, 10), (None, 0)]
+
+
+def is_table_scan(detail: str) -> bool:
+    """
+    "SCAN a" (full scan bảng articles); "SCAN a USING INDEX ..." vẫn chấp nhận được
+    """
+    return detail.startswith("SCAN a") and "USING" not in detail
+
+
+def is_status_lookup(detail: str) -> bool:
+    """
+    Join status phải là lookup theo khoá: "SEARCH s USING PRIMARY KEY (href_hash=?)"
+    """
+    return detail.startswith("SEARCH s USING") and "href_hash=?" in detail
+
+
+def count_status_matches(conn, table: str) -> int:
+    return conn.execute(
+        f"SELECT COUNT(*) FROM articles a JOIN {table} s ON a.href_hash = s.href_hash"
+    ).fetchone()[0]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db", default=os.path.join(os.path.dirname(GUI_DIR), "db", "total_news.db"))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "total_news.db")
+        status_db_path = os.path.join(tmp, "user_state.db")
+        if os.path.exists(args.db):
+            shutil.copyfile(args.db, db_path)
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER, title TEXT, href TEXT, category TEXT, publish_date TEXT,
+                title_latin TEXT, href_hash BLOB, publish_ts INTEGER, source TEXT
+            )
+        """)
+        _total_load.ensure_indexes(conn)
+        _total_load.ensure_fts(conn)
+        _total_load.ensure_stories(conn)
+        has_status = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (STATUS_TABLE,)
+        ).fetchone()
+        matches_before = count_status_matches(conn, STATUS_TABLE) if has_status else 0
+
+        connect_status_db(status_db_path).close()
+        move_status_table(conn, status_db_path)
+        conn.execute(f"ATTACH DATABASE ? AS {STATUS_DB_ALIAS}", (status_db_path,))
+
+        matches_after = count_status_matches(conn, f"{STATUS_DB_ALIAS}.{STATUS_TABLE}")
+        print(f"[INFO] status rows joined: {matches_before} before, {matches_after} after migration")
+        if matches_after < matches_before:
+            print("[FAIL] status migration lost rows")
+            sys.exit(1)
+        conn.execute("ANALYZE")
+        conn.execute(f"ANALYZE {STATUS_DB_ALIAS}")
+
+        failures = 0
+        combos = itertools.product(
+            CATEGORY_OPTIONS, KEYWORD_OPTIONS, SORT_OPTIONS, TIME_OPTIONS, [False, True], [False, True],
+            AFTER_OPTIONS, [False, True]
+        )
+        for categories, keyword, sort, time_filter, filter_read, filter_fav, after, collapse in combos:
+            start_ts, end_ts = time_range(time_filter)
+            query, params = build_article_query(
+                categories, keyword, start_ts, end_ts, filter_read, filter_fav, 100, sort=sort, after=after,
+                collapse=collapse
+            )
+            plan = [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + query, params)]
+            bad = [d for d in plan if is_table_scan(d)]
+            if not any(is_status_lookup(d) for d in plan):
+                bad.append("no status index lookup")
+
+            label = f"cat={len(categories)} kw={bool(keyword)} sort={sort} time={time_filter} read={filter_read} fav={filter_fav} after={after} collapse={collapse}"
+            if bad:
+                failures += 1
+                print(f"[FAIL] {label}: {' | '.join(plan)}")
+            else:
+                print(f"[OK]   {label}: {' | '.join(plan)}")
+
+        conn.close()
+
+    if failures:
+        print(f"[FAIL] {failures} filter combinations fall back to a table scan")
+        sys.exit(1)
+    print("[DONE] No table scan on articles")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Stress test ghi đồng thời: _total_load merge vs GUI ghi Read/Favorite + đọc danh sách
+
+- Thư mục tạm: db/vst.db tổng hợp, mỗi vòng thêm --rows tin rồi chạy _total_load.main()
+- --writers process giả lập GUI ghi trạng thái (save_statuses vào user_state.db) liên tục
+- 1 process giả lập GUI đọc trang đầu (connection đọc + ATTACH user_state như app.py)
+- Lỗi (exit 1) nếu bên nào gặp "database is locked" hoặc exception khác
+
+Chạy từ thư mục gui/:
+    python3 bench/stress_status_merge.py [--rounds 5 --rows 20000 --writers 2]
+"""
+import argparse
+import contextlib
+import hashlib
+import io
+import multiprocessing as mp
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+GUI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ETL_DIR = os.path.join(os.path.dirname(GUI_DIR), "etl")
+sys.path.insert(0, GUI_DIR)
+sys.path.insert(0, ETL_DIR)
+
+import _total_load  # noqa: E402
+from queries import (  # noqa: E402
+    BUSY_TIMEOUT, STATUS_DB_ALIAS, build_article_query, connect_status_db, save_statuses
+)
+
+CATEGORIES = ["chung-khoan", "tai-chinh-ngan-hang", "vi-mo", "bat-dong-san"]
+
+
+def href_hash(i: int) -> bytes:
+    return hashlib.md5(f"https://example.vn/bai-{i}.html".encode()).digest()
+
+
+def add_source_rows(db_path: str, start: int, count: int):
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            href TEXT NOT NULL,
+            category TEXT NOT NULL,
+            publish_date TEXT NOT NULL,
+            title_latin TEXT NOT NULL,
+            href_hash BLOB NOT NULL,
+            publish_ts INTEGER NOT NULL
+        )
+    """)
+    conn.execute("CREATE TABLE IF NOT EXISTS categories (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL UNIQUE)")
+    base_ts = 1767200000
+    with conn:
+        conn.executemany(
+            "INSERT INTO articles (title, href, category, publish_date, title_latin, href_hash, publish_ts) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(
+                f"Tin số {i}: lãi suất ngân hàng",
+                f"https://example.vn/bai-{i}.html",
+                CATEGORIES[i % len(CATEGORIES)],
+                "2026/01/01 00:00:00",
+                f"tin so {i}: lai suat ngan hang",
+                href_hash(i),
+                base_ts + i,
+            ) for i in range(start, start + count)]
+        )
+    conn.close()
+
+
+def use_db_dir(db_dir: str):
+    """
+    _total_load + metric ETL ghi vào thư mục tạm, không đụng db/ thật
+    """
+    _total_load.DB_DIR = db_dir
+    _total_load.OUTPUT_DB = os.path.join(db_dir, "total_news.db")
+    _total_load.metrics.METRICS_DB = os.path.join(db_dir, "etl_metrics.db")
+    _total_load.metrics.METRICS_LOG = os.path.join(db_dir, "etl_runs.jsonl")
+
+
+def merge_worker(db_dir: str, rounds: int, rows: int, results):
+    use_db_dir(db_dir)
+    durations, errors = [], []
+    for r in range(rounds):
+        add_source_rows(os.path.join(db_dir, "vst.db"), r * rows, rows)
+        t0 = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                _total_load.main()
+        except Exception as e:
+            errors.append(repr(e))
+        durations.append(time.perf_counter() - t0)
+    results.put(("merge", durations, errors))
+
+
+def writer_worker(status_db: str, max_hash: int, stop, results):
+    rng = random.Random(os.getpid())
+    latencies, errors = [], []
+    conn = connect_status_db(status_db)
+    while not stop.is_set():
+        batch = {href_hash(rng.randrange(max_hash)): (rng.random() < 0.5, rng.random() < 0.2) for _ in range(5)}
+        t0 = time.perf_counter()
+        try:
+            save_statuses(conn, batch)
+        except Exception as e:
+            errors.append(repr(e))
+        latencies.append(time.perf_counter() - t0)
+        time.sleep(0.01)
+    conn.close()
+    results.put(("writer", latencies, errors))
+
+
+def reader_worker(total_db: str, status_db: str, stop, results):
+    latencies, errors = [], []
+    conn = sqlite3.connect(total_db, timeout=BUSY_TIMEOUT)
+    conn.execute(f"ATTACH DATABASE ? AS {STATUS_DB_ALIAS}", (status_db,))
+    conn.execute("PRAGMA query_only=ON")
+    query, params = build_article_query([], "", None, None, False, False, 100)
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        try:
+            conn.execute(query, params).fetchall()
+        except Exception as e:
+            errors.append(repr(e))
+        latencies.append(time.perf_counter() - t0)
+        time.sleep(0.01)
+    conn.close()
+    results.put(("reader", latencies, errors))
+
+
+def fmt(samples):
+    if not samples:
+        return "no samples"
+    samples = sorted(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    return (
+        f"{len(samples)} ops, p50 {statistics.median(samples) * 1000:.1f} ms, "
+        f"p99 {p99 * 1000:.1f} ms, max {samples[-1] * 1000:.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--writers", type=int, default=2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        total_db = os.path.join(tmp, "total_news.db")
+        status_db = os.path.join(tmp, "user_state.db")
+
+        # Trạng thái ban đầu: 1 lần merge + DB status, như sau khi app khởi động
+        add_source_rows(os.path.join(tmp, "vst.db"), 0, 1)
+        use_db_dir(tmp)
+        with contextlib.redirect_stdout(io.StringIO()):
+            _total_load.main()
+        connect_status_db(status_db).close()
+
+        stop = mp.Event()
+        results = mp.Queue()
+        max_hash = args.rounds * args.rows
+        gui = [mp.Process(target=writer_worker, args=(status_db, max_hash, stop, results))
+               for _ in range(args.writers)]
+        gui.append(mp.Process(target=reader_worker, args=(total_db, status_db, stop, results)))
+        merge = mp.Process(target=merge_worker, args=(tmp, args.rounds, args.rows, results))
+
+        for p in gui:
+            p.start()
+        merge.start()
+
+        reports = [results.get()]  # merge xong trước
+        stop.set()
+        reports += [results.get() for _ in gui]
+        for p in gui + [merge]:
+            p.join()
+
+        failed = False
+        for kind, samples, errors in reports:
+            label = f"{kind} x{args.rows} rows" if kind == "merge" else kind
+            print(f"[STRESS] {label:<16}: {fmt(samples)}, {len(errors)} errors")
+            for err in errors[:3]:
+                print(f"         {err}")
+            failed = failed or bool(errors)
+
+        status_rows = sqlite3.connect(status_db).execute("SELECT COUNT(*) FROM user_article_status").fetchone()[0]
+        total_rows = sqlite3.connect(total_db).execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        print(f"[STRESS] total_news.db: {total_rows} articles, user_state.db: {status_rows} status rows")
+
+    if failed:
+        print("[FAIL] lock errors under concurrent merge + GUI writes")
+        sys.exit(1)
+    print("[DONE] no lock errors")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+import sqlite3
+from datetime import datetime, timedelta
+
+import unidecode
+
+STATUS_TABLE = "user_article_status"
+STATUS_DB_ALIAS = "user_state"  # DB riêng cho trạng thái người dùng, ATTACH vào connection đọc
+BUSY_TIMEOUT = 30  # giây chờ khi DB đang bị process khác ghi
+ARTICLES_TABLE = "articles"
+FTS_TABLE = "articles_fts"  # tạo bởi etl/_total_load.py
+VERSION_TABLE = "data_version"  # _total_load tăng version mỗi lần có dữ liệu mới
+SUMMARY_TABLE = "daily_counts"  # (day, category, source) -> count, _total_load cập nhật
+STORY_COLUMN = "story_id"  # tin trùng giữa các nguồn cùng story_id, _total_load gán
+
+TIME_FILTERS = ["All", "Today", "Yesterday", "This week", "This month"]
+SORT_OPTIONS = ["Time", "Relevance"]
+
+STATUS_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        href_hash BLOB PRIMARY KEY NOT NULL,  -- md5 16 byte, cùng kiểu với articles.href_hash
+        is_read INTEGER NOT NULL DEFAULT 0,
+        is_favorite INTEGER NOT NULL DEFAULT 0
+    ) WITHOUT ROWID
+"""
+
+
+def to_hash_blob(href_hash) -> bytes:
+    """
+    href_hash -> 16 byte BLOB (chấp nhận bytes hoặc chuỗi hex 32 ký tự)
+    """
+    if isinstance(href_hash, str):
+        return bytes.fromhex(href_hash)
+    return bytes(href_hash)
+
+
+def ensure_status_table(conn):
+    """
+    Tạo bảng trạng thái; bảng cũ (href_hash TEXT) được migrate sang BLOB 1 lần
+    """
+    cols = conn.execute(f"PRAGMA table_info({STATUS_TABLE})").fetchall()
+    if not cols:
+        conn.execute(STATUS_SCHEMA.format(name=STATUS_TABLE))
+        conn.commit()
+        return
+
+    hash_type = next(col[2] for col in cols if col[1] == "href_hash")
+    if hash_type.upper() == "BLOB":
+        return
+
+    migrate_status_table(conn)
+
+
+def migrate_status_table(conn):
+    """
+    href_hash TEXT -> BLOB: giá trị hex đổi sang bytes, trùng nhau thì gộp (MAX)
+    """
+    rows = conn.execute(
+        f"SELECT href_hash, IFNULL(is_read,0), IFNULL(is_favorite,0) FROM {STATUS_TABLE}"
+    ).fetchall()
+
+    merged = {}
+    skipped = 0
+    for href_hash, is_read, is_fav in rows:
+        try:
+            key = to_hash_blob(href_hash)
+        except (TypeError, ValueError):
+            skipped += 1
+            continue
+        old_read, old_fav = merged.get(key, (0, 0))
+        merged[key] = (max(old_read, is_read), max(old_fav, is_fav))
+
+    new_table = f"{STATUS_TABLE}_new"
+    with conn:
+        conn.execute(f"DROP TABLE IF EXISTS {new_table}")
+        conn.execute(STATUS_SCHEMA.format(name=new_table))
+        conn.executemany(
+            f"INSERT INTO {new_table} (href_hash, is_read, is_favorite) VALUES (?, ?, ?)",
+            [(h, int(r), int(f)) for h, (r, f) in merged.items()]
+        )
+        conn.execute(f"DROP TABLE {STATUS_TABLE}")
+        conn.execute(f"ALTER TABLE {new_table} RENAME TO {STATUS_TABLE}")
+
+    print(f"[MIGRATE] {STATUS_TABLE}: {len(merged)} rows -> BLOB href_hash, skipped {skipped}")
+
+
+def connect_status_db(path: str, timeout: float = BUSY_TIMEOUT):
+    """
+    Connection ghi DB trạng thái (WAL + busy timeout), tách khỏi total_news.db mà ETL ghi
+    """
+    conn = sqlite3.connect(path, timeout=timeout)
+    conn.execute("PRAGMA journal_mode=WAL")
+    ensure_status_table(conn)
+    return conn
+
+
+def move_status_table(conn, status_db_path: str):
+    """
+    1 lần: chuyển bảng trạng thái cũ trong total_news.db (conn) sang DB trạng thái rồi xoá bảng cũ
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM main.sqlite_master WHERE type='table' AND name=?", (STATUS_TABLE,)
+    ).fetchone()
+    if not exists:
+        return
+
+    # bảng cũ có thể vẫn là href_hash TEXT
+    ensure_status_table(conn)
+
+    conn.execute(f"ATTACH DATABASE ? AS {STATUS_DB_ALIAS}", (status_db_path,))
+    try:
+        with conn:
+            moved = conn.execute(f"""
+            INSERT INTO {STATUS_DB_ALIAS}.{STATUS_TABLE} (href_hash, is_read, is_favorite)
+            SELECT href_hash, is_read, is_favorite FROM main.{STATUS_TABLE} WHERE true
+            ON CONFLICT(href_hash) DO UPDATE SET
+                is_read=MAX(is_read, excluded.is_read),
+                is_favorite=MAX(is_favorite, excluded.is_favorite)
+            """).rowcount
+            conn.execute(f"DROP TABLE main.{STATUS_TABLE}")
+    finally:
+        conn.execute(f"DETACH DATABASE {STATUS_DB_ALIAS}")
+
+    print(f"[MIGRATE] {STATUS_TABLE}: moved {moved} rows -> {status_db_path}")
+
+
+def save_statuses(conn, statuses: dict):
+    """
+    Ghi trạng thái Read/Favorite đã đổi trong 1 transaction
+    statuses: {href_hash: (is_read, is_favorite)}
+    """
+    with conn:
+        conn.executemany(f"""
+        INSERT INTO {STATUS_TABLE} (href_hash, is_read, is_favorite)
+        VALUES (?, ?, ?)
+        ON CONFLICT(href_hash) DO UPDATE SET
+            is_read=excluded.is_read,
+            is_favorite=excluded.is_favorite
+        """, [(to_hash_blob(h), int(r), int(f)) for h, (r, f) in statuses.items()])
+
+
+def data_version(conn) -> int:
+    """
+    Version dữ liệu do _total_load ghi, 0 nếu DB chưa có bảng version
+    """
+    try:
+        row = conn.execute(f"SELECT version FROM {VERSION_TABLE} WHERE id = 1").fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return row[0] if row else 0
+
+
+def load_categories(conn, limit: int = 4) -> list:
+    rows = conn.execute(
+        "SELECT DISTINCT category FROM categories ORDER BY category LIMIT ?", (limit,)
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def load_counts(conn, start_day: str = None, end_day: str = None) -> list:
+    """
+    Số tin theo (category, source) trong khoảng ngày [start_day, end_day] ("YYYY-MM-DD"),
+    đọc từ bảng tổng hợp, không quét articles. None nếu DB chưa có bảng tổng hợp.
+    """
+    query = f"SELECT category, source, SUM(count) FROM {SUMMARY_TABLE}"
+    params = []
+    if start_day is not None and end_day is not None:
+        query += " WHERE day BETWEEN ? AND ?"
+        params = [start_day, end_day]
+    query += " GROUP BY category, source ORDER BY category, source"
+    try:
+        return conn.execute(query, params).fetchall()
+    except sqlite3.OperationalError:
+        return None
+
+
+def has_fts(conn) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (FTS_TABLE,)
+    ).fetchone()
+    return row is not None
+
+
+def has_stories(conn) -> bool:
+    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({ARTICLES_TABLE})")}
+    return STORY_COLUMN in columns
+
+
+def keyword_words(keyword: str) -> list:
+    """
+    Keyword -> list từ latin không dấu, lowercase
+    """
+    keyword_latin = unidecode.unidecode((keyword or "").lower())
+    return [w.strip() for w in keyword_latin.split() if w.strip()]
+
+
+def fts_query(keyword: str):
+    """
+    Keyword -> biểu thức FTS5 MATCH: mọi từ đều phải có, khớp theo tiền tố
+    "ngan hang" -> "ngan"* AND "hang"*
+    """
+    terms = []
+    for w in keyword_words(keyword):
+        # bỏ từ chỉ gồm dấu câu (tokenizer không sinh token nào)
+        if not any(ch.isalnum() for ch in w):
+            continue
+        terms.append('"' + w.replace('"', '""') + '"*')
+    return " AND ".join(terms) or None
+
+
+def time_range(time_filter: str, now: datetime = None):
+    """
+    Trả về (start_ts, end_ts) cho bộ lọc thời gian, (None, None) nếu "All"
+    """
+    now = now or datetime.now()
+    if time_filter == "Today":
+        start_ts = int(datetime(now.year, now.month, now.day).timestamp())
+        end_ts = int(now.timestamp())
+    elif time_filter == "Yesterday":
+        yesterday = now - timedelta(days=1)
+        start_ts = int(datetime(yesterday.year, yesterday.month, yesterday.day).timestamp())
+        end_ts = int(datetime(now.year, now.month, now.day).timestamp())
+    elif time_filter == "This week":
+        start_of_week = now - timedelta(days=now.weekday())
+        start_ts = int(datetime(start_of_week.year, start_of_week.month, start_of_week.day).timestamp())
+        end_ts = int(now.timestamp())
+    elif time_filter == "This month":
+        start_ts = int(datetime(now.year, now.month, 1).timestamp())
+        end_ts = int(now.timestamp())
+    else:
+        start_ts = None
+        end_ts = None
+    return start_ts, end_ts
+
+
+def keyset_clause(after):
+    """
+    Điều kiện "sau cursor" cho thứ tự publish_ts DESC, rowid ASC (đúng thứ tự index publish_ts DESC)
+    after = (publish_ts, rowid) của dòng cuối đã tải; publish_ts None = đang ở phần tin không có ngày
+    """
+    ts, rid = after
+    if ts is None:
+        return " AND a.publish_ts IS NULL AND a.rowid > ?", [rid]
+    return " AND a.publish_ts <= ? AND (a.publish_ts < ? OR a.rowid > ?)", [ts, ts, rid]
+
+
+def filter_clauses(alias, selected_categories, keyword, match, start_ts, end_ts,
+                   filter_read, filter_fav, status):
+    """
+    Điều kiện category / keyword (LIKE khi không có FTS) / thời gian / Read / Favorite trên bảng alias,
+    trả về (sql, params). status: biểu thức cột trạng thái, "{col}" thay bằng is_read / is_favorite.
+    Keyword qua FTS (match) không nằm ở đây: query chính JOIN bảng FTS, subquery collapse dùng rowid IN.
+    """
+    query = ""
+    params = []
+
+    # Category filter
+    if selected_categories:
+        placeholders = ",".join("?" for _ in selected_categories)
+        query += f" AND {alias}.category IN ({placeholders})"
+        params.extend(selected_categories)
+
+    # Keyword không dùng được FTS (DB chưa có FTS, keyword chỉ có dấu câu): LIKE cho từng từ
+    if keyword and not match:
+        for w in keyword_words(keyword):
+            query += f" AND lower({alias}.title_latin) LIKE ?"
+            params.append(f"%{w}%")
+
+    # Time filter
+    if start_ts is not None and end_ts is not None:
+        query += f" AND {alias}.publish_ts BETWEEN ? AND ?"
+        params.extend([start_ts, end_ts])
+
+    # Read/fav
+    if filter_read:
+        query += f" AND IFNULL({status.format(col='is_read')},0)=1"
+    if filter_fav:
+        query += f" AND IFNULL({status.format(col='is_favorite')},0)=1"
+
+    return query, params
+
+
+def day_range(time_filter: str, now: datetime = None):
+    """
+    Khoảng ngày (start_day, end_day) tính cả 2 đầu, cùng nghĩa với time_range; (None, None) nếu "All"
+    """
+    now = now or datetime.now()
+    today = now.date()
+    if time_filter == "Today":
+        start, end = today, today
+    elif time_filter == "Yesterday":
+        start = end = today - timedelta(days=1)
+    elif time_filter == "This week":
+        start, end = today - timedelta(days=today.weekday()), today
+    elif time_filter == "This month":
+        start, end = today.replace(day=1), today
+    else:
+        return None, None
+    return start.isoformat(), end.isoformat()
+
+
+def build_article_query(selected_categories, keyword, start_ts, end_ts,
+                        filter_read, filter_fav, limit, sort="Time", use_fts=True,
+                        after=None, offset=0, collapse=False):
+    """
+    Dựng câu query danh sách tin cho GUI, trả về (sql, params)
+    - use_fts: keyword tìm qua FTS5 (MATCH + bm25), False thì LIKE từng từ (DB chưa có FTS)
+    - sort: "Time" (mới nhất trước) hoặc "Relevance" (bm25, chỉ khi có keyword)
+    - after: keyset cursor (publish_ts, rowid) khi sort theo thời gian, chỉ lấy các dòng sau cursor
+    - offset: phân trang cho sort theo độ liên quan (bm25 không có cursor ổn định)
+    - collapse: mỗi story chỉ hiện tin đầu tiên (rowid nhỏ nhất) trong các tin khớp filter, kèm story_size
+    """
+    params = []
+    match = fts_query(keyword) if use_fts else None
+    story_size = (
+        f",\n       (SELECT COUNT(*) FROM {ARTICLES_TABLE} c WHERE c.{STORY_COLUMN} = a.{STORY_COLUMN}) AS story_size"
+        if collapse else ""
+    )
+
+    if match:
+        query = f"""
+SELECT a.rowid AS rid, a.title, a.title_latin, a.href, a.href_hash, a.publish_date, a.publish_ts, a.category, a.source,
+       IFNULL(s.is_read,0) AS is_read, IFNULL(s.is_favorite,0) AS is_favorite{story_size}
+FROM {FTS_TABLE} f
+JOIN {ARTICLES_TABLE} a ON a.rowid = f.rowid
+LEFT JOIN {STATUS_DB_ALIAS}.{STATUS_TABLE} s ON a.href_hash = s.href_hash
+WHERE {FTS_TABLE} MATCH ?
+"""
+        params.append(match)
+    else:
+        query = f"""
+SELECT a.rowid AS rid, a.title, a.title_latin, a.href, a.href_hash, a.publish_date, a.publish_ts, a.category, a.source,
+       IFNULL(s.is_read,0) AS is_read, IFNULL(s.is_favorite,0) AS is_favorite{story_size}
+FROM {ARTICLES_TABLE} a
+LEFT JOIN {STATUS_DB_ALIAS}.{STATUS_TABLE} s ON a.href_hash = s.href_hash
+WHERE 1=1
+"""
+
+    clauses, clause_params = filter_clauses(
+        "a", selected_categories, keyword, match, start_ts, end_ts, filter_read, filter_fav,
+        status="s.{col}"
+    )
+    query += clauses
+    params.extend(clause_params)
+
+    # Collapse: bỏ tin nếu cùng story đã có tin rowid nhỏ hơn cũng khớp mọi filter đang chọn
+    if collapse:
+        clauses, clause_params = filter_clauses(
+            "d", selected_categories, keyword, match, start_ts, end_ts, filter_read, filter_fav,
+            status=f"(SELECT ds.{{col}} FROM {STATUS_DB_ALIAS}.{STATUS_TABLE} ds WHERE ds.href_hash = d.href_hash)"
+        )
+        query += f"""
+ AND NOT EXISTS (SELECT 1 FROM {ARTICLES_TABLE} d WHERE d.{STORY_COLUMN} = a.{STORY_COLUMN} AND d.rowid < a.rowid"""
+        if match:
+            query += f" AND d.rowid IN (SELECT df.rowid FROM {FTS_TABLE} df WHERE {FTS_TABLE} MATCH ?)"
+            params.append(match)
+        query += clauses + ")"
+        params.extend(clause_params)
+
+    # Sort & limit
+    if match and sort == "Relevance":
+        query += f" ORDER BY bm25({FTS_TABLE}), a.publish_ts DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+        return query, params
+
+    # Keyset
+    if after is not None:
+        clause, clause_params = keyset_clause(after)
+        query += clause
+        params.extend(clause_params)
+
+    query += " ORDER BY a.publish_ts DESC, a.rowid LIMIT ?"
+    params.append(limit)
+
+    return query, params
@@ -11,6 +11,8 @@ AIRFLOW_VERSION=2.9.1
 PYTHON_VERSION=3.11
 CONSTRAINT_URL="https://raw.githubusercontent.com/apache/airflow/constraints-${AIRFLOW_VERSION}/constraints-${PYTHON_VERSION}.txt"
 pip install "apache-airflow==${AIRFLOW_VERSION}" --constraint "${CONSTRAINT_URL}"
+# DAG update_all_fast chạy pipeline ETL ngay trong interpreter của Airflow
+pip install --constraint "${CONSTRAINT_URL}" requests lxml
 deactivate
 
 # ETL